@@ -1,15 +1,49 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.routers import pricing, greeks, hedging
 from api.schemas import HealthResponse
+from pricing import binomial_price, binomial_price_spots, binomial_price_steps, mc_price
+from pricing.delta_hedging import run_delta_hedge_batch, simulate_delta_hedging
+from pricing.hedging_analysis import compare_hedging_frequencies
+
+
+def _warm_up_kernels() -> None:
+    """Compile (or load from the on-disk cache) the Numba kernels behind the routes.
+
+    Tiny calls through the public entry points compile each kernel for the
+    argument types the routes use, so no request pays first-call JIT latency.
+    """
+    binomial_price(100.0, 100.0, 0.05, 0.2, 1.0, 10, option="call")
+    binomial_price_steps(100.0, 100.0, 0.05, 0.2, 1.0, [5, 10], option="call")
+    binomial_price_spots([90.0, 100.0, 110.0], 100.0, 0.05, 0.2, 1.0, 10, option="call")
+    mc_price(100.0, 100.0, 0.05, 0.2, 1.0, 64, option="call", return_stderr=True)
+    simulate_delta_hedging(100.0, 100.0, 0.05, 0.2, 1.0, "call", "monthly", seed=0)
+    compare_hedging_frequencies(100.0, 100.0, 0.05, 0.2, 1.0, "call", ["monthly"], num_simulations=10)
+    run_delta_hedge_batch(100.0, 100.0, 0.2, 0.05, 1.0, "call", 12, 4, seed=0)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the compiled kernels once per worker before serving requests."""
+    # Run on the main thread, not via asyncio.to_thread: a parallel kernel's
+    # thread pool started from a worker thread can hang interpreter shutdown
+    # (reloads, stops). Startup blocks until the warm-up is done either way.
+    _warm_up_kernels()
+    yield
+
 
 app = FastAPI(
     title="Option Pricing API",
     description="API for calculating option prices using Black-Scholes, Binomial, and Monte Carlo methods",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
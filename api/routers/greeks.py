@@ -1,28 +1,33 @@
 """Greeks API endpoints."""
 
-from typing import List
-
+import numpy as np
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from api.schemas import (
     GreeksRequest,
     GreeksResponse,
     GreeksSensitivityRequest,
     GreeksSensitivityResponse,
-    GreeksSensitivityDataPoint,
     GreeksCompareRequest,
     GreeksCompareResponse,
     GreeksMethodCompareRequest,
     GreeksMethodCompareResponse,
-    OptionConfig,
 )
-from pricing.greeks import calculate_all_greeks, calculate_all_greeks_comparison, delta, gamma, theta, vega, rho
+from pricing.greeks import (
+    calculate_all_greeks,
+    calculate_all_greeks_comparison,
+    calculate_all_greeks_vec,
+)
 
 router = APIRouter(prefix="/api/greeks", tags=["greeks"])
 
+# Position of each sweepable parameter in the (S0, K, r, sigma, T) argument list
+_PARAM_INDEX = {"S0": 0, "K": 1, "r": 2, "sigma": 3, "T": 4}
+
 
 @router.post("/calculate", response_model=GreeksResponse)
-async def calculate_greeks(request: GreeksRequest) -> GreeksResponse:
+def calculate_greeks(request: GreeksRequest) -> GreeksResponse:
     """Calculate all Greeks for an option."""
     try:
         greeks = calculate_all_greeks(
@@ -33,12 +38,12 @@ async def calculate_greeks(request: GreeksRequest) -> GreeksResponse:
             request.T,
             request.option_type,
         )
-        return GreeksResponse(
-            delta=round(greeks["delta"], 6),
-            gamma=round(greeks["gamma"], 6),
-            theta=round(greeks["theta"], 6),
-            vega=round(greeks["vega"], 6),
-            rho=round(greeks["rho"], 6),
+        return GreeksResponse.model_construct(
+            delta=round(greeks.delta, 6),
+            gamma=round(greeks.gamma, 6),
+            theta=round(greeks.theta, 6),
+            vega=round(greeks.vega, 6),
+            rho=round(greeks.rho, 6),
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -47,64 +52,47 @@ async def calculate_greeks(request: GreeksRequest) -> GreeksResponse:
 
 
 @router.post("/sensitivity", response_model=GreeksSensitivityResponse)
-async def calculate_greeks_sensitivity(request: GreeksSensitivityRequest) -> GreeksSensitivityResponse:
+def calculate_greeks_sensitivity(request: GreeksSensitivityRequest) -> ORJSONResponse:
     """Calculate Greeks sensitivity across a parameter range."""
     try:
-        # Validate parameter name
-        valid_params = {"S0", "K", "r", "sigma", "T"}
-        if request.parameter not in valid_params:
+        # Resolve the swept parameter to its position in (S0, K, r, sigma, T) once
+        param_idx = _PARAM_INDEX.get(request.parameter)
+        if param_idx is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Parameter must be one of: {', '.join(valid_params)}",
-            )
-
-        # Create base parameters dict
-        base_params = {
-            "S0": request.S0,
-            "K": request.K,
-            "r": request.r,
-            "sigma": request.sigma,
-            "T": request.T,
-        }
-
-        # Generate parameter values
-        min_val = request.min_value
-        max_val = request.max_value
-        steps = request.steps
-        param_values = [min_val + (max_val - min_val) * i / (steps - 1) for i in range(steps)]
-
-        data_points: List[GreeksSensitivityDataPoint] = []
-
-        for param_value in param_values:
-            # Update the parameter being varied
-            params = base_params.copy()
-            params[request.parameter] = param_value
-
-            # Calculate Greeks
-            greeks = calculate_all_greeks(
-                params["S0"],
-                params["K"],
-                params["r"],
-                params["sigma"],
-                params["T"],
-                request.option_type,
+                detail=f"Parameter must be one of: {', '.join(_PARAM_INDEX)}",
             )
 
-            data_points.append(
-                GreeksSensitivityDataPoint(
-                    parameter_value=round(param_value, 6),
-                    delta=round(greeks["delta"], 6),
-                    gamma=round(greeks["gamma"], 6),
-                    theta=round(greeks["theta"], 6),
-                    vega=round(greeks["vega"], 6),
-                    rho=round(greeks["rho"], 6),
-                )
+        # Sweep the varied parameter as one array; the others broadcast as scalars
+        param_values = np.linspace(request.min_value, request.max_value, request.steps)
+        inputs = [request.S0, request.K, request.r, request.sigma, request.T]
+        inputs[param_idx] = param_values
+
+        greeks = calculate_all_greeks_vec(*inputs, request.option_type)
+
+        # Known-valid internal data: serialize plain dicts directly with orjson
+        # instead of building and validating one model per point. Each series
+        # is rounded once with NumPy rather than per field.
+        data_points = [
+            {
+                "parameter_value": param_value,
+                "delta": d,
+                "gamma": g,
+                "theta": th,
+                "vega": v,
+                "rho": rh,
+            }
+            for param_value, d, g, th, v, rh in zip(
+                np.round(param_values, 6).tolist(),
+                np.round(greeks["delta"], 6).tolist(),
+                np.round(greeks["gamma"], 6).tolist(),
+                np.round(greeks["theta"], 6).tolist(),
+                np.round(greeks["vega"], 6).tolist(),
+                np.round(greeks["rho"], 6).tolist(),
             )
+        ]
 
-        return GreeksSensitivityResponse(
-            data=data_points,
-            parameter_name=request.parameter,
-        )
+        return ORJSONResponse({"data": data_points, "parameter_name": request.parameter})
     except HTTPException:
         raise
     except ValueError as e:
@@ -114,37 +102,37 @@ async def calculate_greeks_sensitivity(request: GreeksSensitivityRequest) -> Gre
 
 
 @router.post("/compare", response_model=GreeksCompareResponse)
-async def compare_greeks(request: GreeksCompareRequest) -> GreeksCompareResponse:
+def compare_greeks(request: GreeksCompareRequest) -> GreeksCompareResponse:
     """Compare Greeks across multiple option configurations."""
     try:
-        comparisons = []
-
-        for option in request.options:
-            greeks = calculate_all_greeks(
-                option.S0,
-                option.K,
-                option.r,
-                option.sigma,
-                option.T,
-                option.option_type,
-            )
-
-            comparisons.append(
-                {
-                    "label": option.label,
-                    "S0": option.S0,
-                    "K": option.K,
-                    "r": option.r,
-                    "sigma": option.sigma,
-                    "T": option.T,
-                    "option_type": option.option_type,
-                    "delta": round(greeks["delta"], 6),
-                    "gamma": round(greeks["gamma"], 6),
-                    "theta": round(greeks["theta"], 6),
-                    "vega": round(greeks["vega"], 6),
-                    "rho": round(greeks["rho"], 6),
-                }
-            )
+        options = request.options
+        S0 = np.array([o.S0 for o in options])
+        K = np.array([o.K for o in options])
+        r = np.array([o.r for o in options])
+        sigma = np.array([o.sigma for o in options])
+        T = np.array([o.T for o in options])
+        option_types = np.array([o.option_type for o in options])
+
+        # One vectorized pass over the whole book, calls and puts together
+        greeks = calculate_all_greeks_vec(S0, K, r, sigma, T, option_types)
+
+        comparisons = [
+            {
+                "label": option.label,
+                "S0": option.S0,
+                "K": option.K,
+                "r": option.r,
+                "sigma": option.sigma,
+                "T": option.T,
+                "option_type": option.option_type,
+                "delta": round(float(greeks["delta"][i]), 6),
+                "gamma": round(float(greeks["gamma"][i]), 6),
+                "theta": round(float(greeks["theta"][i]), 6),
+                "vega": round(float(greeks["vega"][i]), 6),
+                "rho": round(float(greeks["rho"][i]), 6),
+            }
+            for i, option in enumerate(options)
+        ]
 
         return GreeksCompareResponse(comparisons=comparisons)
     except ValueError as e:
@@ -154,7 +142,7 @@ async def compare_greeks(request: GreeksCompareRequest) -> GreeksCompareResponse
 
 
 @router.post("/compare-methods", response_model=GreeksMethodCompareResponse)
-async def compare_greeks_methods(request: GreeksMethodCompareRequest) -> GreeksMethodCompareResponse:
+def compare_greeks_methods(request: GreeksMethodCompareRequest) -> GreeksMethodCompareResponse:
     """Compare Greeks calculated using Black-Scholes, Binomial, and Monte Carlo methods."""
     try:
         comparison = calculate_all_greeks_comparison(
@@ -1,30 +1,42 @@
 """Delta hedging API endpoints."""
 
-from typing import List
+import asyncio
 
-from fastapi import APIRouter, HTTPException
+import msgspec
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from api.schemas import (
     HedgingSimulateRequest,
+    HedgingSimulateRequestStruct,
     HedgingSimulateResponse,
-    HedgingDataPoint,
-    HedgingTransaction,
-    HedgingSummary,
     HedgingCompareRequest,
     HedgingCompareResponse,
     HedgingFrequencyStats,
+    decode_request,
+    openapi_request_body,
 )
 from pricing.delta_hedging import simulate_delta_hedging
 from pricing.hedging_analysis import compare_hedging_frequencies
 
 router = APIRouter(prefix="/api/hedging", tags=["hedging"])
 
+_SIMULATE_DECODER = msgspec.json.Decoder(HedgingSimulateRequestStruct, strict=False)
 
-@router.post("/simulate", response_model=HedgingSimulateResponse)
-async def simulate_hedging(request: HedgingSimulateRequest) -> HedgingSimulateResponse:
+
+@router.post(
+    "/simulate",
+    response_model=HedgingSimulateResponse,
+    openapi_extra=openapi_request_body(HedgingSimulateRequest),
+)
+async def simulate_hedging(http_request: Request) -> ORJSONResponse:
     """Simulate delta hedging for a single path."""
+    request = decode_request(_SIMULATE_DECODER, await http_request.body())
     try:
-        result = simulate_delta_hedging(
+        # Reading the raw body needs an async handler; keep the simulation
+        # itself off the event loop
+        result = await asyncio.to_thread(
+            simulate_delta_hedging,
             S0=request.S0,
             K=request.K,
             r=request.r,
@@ -35,59 +47,90 @@ async def simulate_hedging(request: HedgingSimulateRequest) -> HedgingSimulateRe
             transaction_cost=request.transaction_cost,
             option_contracts=request.option_contracts,
             initial_option_position=request.initial_option_position,
+            rebalance_threshold=request.rebalance_threshold,
         )
         
-        # Convert time series to data points
+        # Convert structure-of-arrays time series to plain records. The kernel
+        # output is known-valid, so skip the per-point models and serialize the
+        # dicts directly with orjson; the response model still documents them.
+        # Columns are unboxed to Python floats in bulk with tolist()
+        ts = result["time_series"]
         time_series = [
-            HedgingDataPoint(
-                time=point["time"],
-                stock_price=point["stock_price"],
-                delta=point["delta"],
-                hedge_shares=point["hedge_shares"],
-                option_value=point["option_value"],
-                cash=point.get("cash", 0.0),
-                portfolio_value=point["portfolio_value"],
-                pnl=point["pnl"],
-                cumulative_transaction_cost=point["cumulative_transaction_cost"],
+            {
+                "time": t,
+                "stock_price": s,
+                "delta": d,
+                "hedge_shares": h,
+                "option_value": o,
+                "cash": c,
+                "portfolio_value": pv,
+                "pnl": pnl,
+                "cumulative_transaction_cost": tx,
+            }
+            for t, s, d, h, o, c, pv, pnl, tx in zip(
+                ts["time"].tolist(),
+                ts["stock_price"].tolist(),
+                ts["delta"].tolist(),
+                ts["hedge_shares"].tolist(),
+                ts["option_value"].tolist(),
+                ts["cash"].tolist(),
+                ts["portfolio_value"].tolist(),
+                ts["pnl"].tolist(),
+                ts["cumulative_transaction_cost"].tolist(),
             )
-            for point in result["time_series"]
         ]
         
-        # Convert transactions to data points
+        # Convert structure-of-arrays transactions to plain records
+        txs = result["transactions"]
         transactions = [
-            HedgingTransaction(
-                time=tx["time"],
-                stock_price=tx["stock_price"],
-                delta=tx["delta"],
-                delta_change=tx["delta_change"],
-                shares_traded=tx["shares_traded"],
-                total_shares=tx["total_shares"],
-                trade_cost=tx["trade_cost"],
-                transaction_type=tx["transaction_type"],
-                transaction_pnl=tx.get("transaction_pnl", 0.0),
-                total_pnl=tx.get("total_pnl", 0.0),
-                option_loss_since_last=tx.get("option_loss_since_last", 0.0),
-                portfolio_pnl=tx.get("portfolio_pnl", 0.0),
+            {
+                "time": t,
+                "stock_price": s,
+                "delta": d,
+                "delta_change": dc,
+                "shares_traded": st,
+                "total_shares": total,
+                "trade_cost": tc,
+                "transaction_type": tt,
+                "transaction_pnl": tp,
+                "total_pnl": cum_pnl,
+                "option_loss_since_last": ol,
+                "portfolio_pnl": pp,
+            }
+            for t, s, d, dc, st, total, tc, tt, tp, cum_pnl, ol, pp in zip(
+                txs["time"],
+                txs["stock_price"],
+                txs["delta"],
+                txs["delta_change"],
+                txs["shares_traded"],
+                txs["total_shares"],
+                txs["trade_cost"],
+                txs["transaction_type"],
+                txs["transaction_pnl"],
+                txs["total_pnl"],
+                txs["option_loss_since_last"],
+                txs["portfolio_pnl"],
             )
-            for tx in result.get("transactions", [])
         ]
         
-        summary = HedgingSummary(
-            total_pnl=result["summary"].get("total_pnl", result["summary"]["final_pnl"]),
-            final_pnl=result["summary"]["final_pnl"],
-            option_pnl=result["summary"]["option_pnl"],
-            hedging_pnl=result["summary"].get("hedging_pnl", 0.0),
-            replication_error=result["summary"].get("replication_error", result["summary"].get("hedging_error", 0.0)),
-            total_transaction_cost=result["summary"]["total_transaction_cost"],
-            hedging_error=result["summary"].get("hedging_error", result["summary"].get("replication_error", 0.0)),
-            max_drawdown=result["summary"]["max_drawdown"],
-            final_portfolio_value=result["summary"]["final_portfolio_value"],
-        )
+        summary = {
+            "total_pnl": result["summary"].get("total_pnl", result["summary"]["final_pnl"]),
+            "final_pnl": result["summary"]["final_pnl"],
+            "option_pnl": result["summary"]["option_pnl"],
+            "hedging_pnl": result["summary"].get("hedging_pnl", 0.0),
+            "replication_error": result["summary"].get("replication_error", result["summary"].get("hedging_error", 0.0)),
+            "total_transaction_cost": result["summary"]["total_transaction_cost"],
+            "hedging_error": result["summary"].get("hedging_error", result["summary"].get("replication_error", 0.0)),
+            "max_drawdown": result["summary"]["max_drawdown"],
+            "final_portfolio_value": result["summary"]["final_portfolio_value"],
+        }
         
-        return HedgingSimulateResponse(
-            time_series=time_series,
-            transactions=transactions,
-            summary=summary,
+        return ORJSONResponse(
+            {
+                "time_series": time_series,
+                "transactions": transactions,
+                "summary": summary,
+            }
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -96,7 +139,7 @@ async def simulate_hedging(request: HedgingSimulateRequest) -> HedgingSimulateRe
 
 
 @router.post("/compare-frequencies", response_model=HedgingCompareResponse)
-async def compare_frequencies(request: HedgingCompareRequest) -> HedgingCompareResponse:
+def compare_frequencies(request: HedgingCompareRequest) -> HedgingCompareResponse:
     """Compare hedging effectiveness across different rebalancing frequencies."""
     try:
         results = compare_hedging_frequencies(
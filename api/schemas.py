@@ -1,15 +1,17 @@
 """Pydantic schemas for request/response validation."""
 
-from typing import Literal
+from typing import Annotated, Any, Dict, Literal, Type
 
+import msgspec
+from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, Field
 
 
 OptionType = Literal["call", "put"]
 
 
-class PricingRequest(BaseModel):
-    """Request schema for option pricing calculation."""
+class _BaseOptionParams(BaseModel):
+    """Option parameters shared by every request schema."""
 
     S0: float = Field(gt=0, description="Initial stock price")
     K: float = Field(gt=0, description="Strike price")
@@ -17,6 +19,11 @@ class PricingRequest(BaseModel):
     sigma: float = Field(gt=0, description="Volatility")
     T: float = Field(gt=0, description="Time to maturity (years)")
     option_type: OptionType = Field(description="Option type: 'call' or 'put'")
+
+
+class PricingRequest(_BaseOptionParams):
+    """Request schema for option pricing calculation."""
+
     binomial_steps: int = Field(default=100, ge=1, le=10000, description="Number of steps for binomial model")
     mc_simulations: int = Field(default=100000, ge=100, le=10000000, description="Number of Monte Carlo simulations")
 
@@ -31,16 +38,9 @@ class PricingResponse(BaseModel):
     comparison: dict = Field(description="Comparison metrics")
 
 
-class ConvergenceRequest(BaseModel):
+class ConvergenceRequest(_BaseOptionParams):
     """Request schema for convergence analysis."""
 
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
-
 
 class ConvergenceDataPoint(BaseModel):
     """Single data point for convergence plot."""
@@ -70,16 +70,9 @@ class HealthResponse(BaseModel):
 
 
 # Greeks schemas
-class GreeksRequest(BaseModel):
+class GreeksRequest(_BaseOptionParams):
     """Request schema for Greeks calculation."""
 
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
-
 
 class GreeksResponse(BaseModel):
     """Response schema for Greeks calculation."""
@@ -91,15 +84,12 @@ class GreeksResponse(BaseModel):
     rho: float = Field(description="Rho: sensitivity to interest rate")
 
 
-class GreeksSensitivityRequest(BaseModel):
-    """Request schema for Greeks sensitivity analysis."""
+class GreeksSensitivityRequest(_BaseOptionParams):
+    """Request schema for Greeks sensitivity analysis.
+
+    The option fields give the base point that the swept parameter varies from.
+    """
 
-    S0: float = Field(gt=0, description="Base initial stock price")
-    K: float = Field(gt=0, description="Base strike price")
-    r: float = Field(ge=0, description="Base risk-free rate")
-    sigma: float = Field(gt=0, description="Base volatility")
-    T: float = Field(gt=0, description="Base time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
     parameter: str = Field(description="Parameter to vary: 'S0', 'K', 'r', 'sigma', or 'T'")
     min_value: float = Field(description="Minimum value for parameter range")
     max_value: float = Field(description="Maximum value for parameter range")
@@ -124,16 +114,10 @@ class GreeksSensitivityResponse(BaseModel):
     parameter_name: str = Field(description="Name of the varied parameter")
 
 
-class OptionConfig(BaseModel):
+class OptionConfig(_BaseOptionParams):
     """Configuration for a single option in comparison."""
 
     label: str = Field(description="Label for this option configuration")
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
 
 
 class GreeksCompareRequest(BaseModel):
@@ -148,15 +132,9 @@ class GreeksCompareResponse(BaseModel):
     comparisons: list[dict] = Field(description="List of option configs with their Greeks values")
 
 
-class GreeksMethodCompareRequest(BaseModel):
+class GreeksMethodCompareRequest(_BaseOptionParams):
     """Request schema for comparing Greeks across pricing methods."""
 
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
     binomial_steps: int = Field(default=1000, ge=1, le=10000, description="Number of steps for binomial model")
     mc_simulations: int = Field(default=100000, ge=100, le=10000000, description="Number of Monte Carlo simulations")
     theta_period: Literal["day", "year"] = Field(default="year", description="Time period for theta: 'day' or 'year'")
@@ -171,20 +149,15 @@ class GreeksMethodCompareResponse(BaseModel):
 
 
 # Hedging schemas
-class HedgingSimulateRequest(BaseModel):
+class HedgingSimulateRequest(_BaseOptionParams):
     """Request schema for delta hedging simulation."""
 
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
     rebalance_freq: str = Field(description="Rebalancing frequency: 'daily', 'weekly', 'biweekly', 'monthly', or custom days")
     transaction_cost: float = Field(default=0.0, ge=0, le=0.1, description="Transaction cost as fraction (e.g., 0.001 = 0.1%)")
     num_simulations: int = Field(default=1, ge=1, le=1000, description="Number of simulation paths")
     option_contracts: int = Field(default=1, ge=1, description="Number of option contracts (100 shares per contract)")
     initial_option_position: float = Field(default=1.0, description="Initial option position (usually +1 for long one option)")
+    rebalance_threshold: float = Field(default=0.0, ge=0, description="Minimum hedge change in shares worth trading; smaller changes are skipped (band hedging)")
 
 
 class HedgingDataPoint(BaseModel):
@@ -240,15 +213,9 @@ class HedgingSimulateResponse(BaseModel):
     summary: HedgingSummary = Field(description="Summary statistics")
 
 
-class HedgingCompareRequest(BaseModel):
+class HedgingCompareRequest(_BaseOptionParams):
     """Request schema for comparing different hedging frequencies."""
 
-    S0: float = Field(gt=0, description="Initial stock price")
-    K: float = Field(gt=0, description="Strike price")
-    r: float = Field(ge=0, description="Risk-free rate")
-    sigma: float = Field(gt=0, description="Volatility")
-    T: float = Field(gt=0, description="Time to maturity (years)")
-    option_type: OptionType = Field(description="Option type: 'call' or 'put'")
     frequencies: list[str] = Field(min_length=1, max_length=10, description="List of rebalancing frequencies to compare")
     transaction_cost: float = Field(default=0.0, ge=0, le=0.1, description="Transaction cost as fraction")
     num_simulations: int = Field(default=100, ge=10, le=1000, description="Number of simulation paths per frequency")
@@ -272,3 +239,57 @@ class HedgingCompareResponse(BaseModel):
 
     comparisons: list[HedgingFrequencyStats] = Field(description="Statistics for each frequency")
 
+
+# msgspec mirrors of the hot request models. Their routes decode the raw body
+# with a module-level msgspec decoder, skipping Pydantic validation on the
+# request path; the Pydantic classes above still describe the body in OpenAPI.
+# The decoders use strict=False so that, like Pydantic's lax mode, numeric
+# strings such as "100" are accepted for number fields.
+
+class _BaseOptionStruct(msgspec.Struct, frozen=True):
+    """msgspec mirror of _BaseOptionParams."""
+
+    S0: Annotated[float, msgspec.Meta(gt=0)]
+    K: Annotated[float, msgspec.Meta(gt=0)]
+    r: Annotated[float, msgspec.Meta(ge=0)]
+    sigma: Annotated[float, msgspec.Meta(gt=0)]
+    T: Annotated[float, msgspec.Meta(gt=0)]
+    option_type: OptionType
+
+
+class PricingRequestStruct(_BaseOptionStruct, frozen=True):
+    """msgspec mirror of PricingRequest."""
+
+    binomial_steps: Annotated[int, msgspec.Meta(ge=1, le=10000)] = 100
+    mc_simulations: Annotated[int, msgspec.Meta(ge=100, le=10000000)] = 100000
+
+
+class HedgingSimulateRequestStruct(_BaseOptionStruct, frozen=True):
+    """msgspec mirror of HedgingSimulateRequest."""
+
+    rebalance_freq: str
+    transaction_cost: Annotated[float, msgspec.Meta(ge=0, le=0.1)] = 0.0
+    num_simulations: Annotated[int, msgspec.Meta(ge=1, le=1000)] = 1
+    option_contracts: Annotated[int, msgspec.Meta(ge=1)] = 1
+    initial_option_position: float = 1.0
+    rebalance_threshold: Annotated[float, msgspec.Meta(ge=0)] = 0.0
+
+
+def decode_request(decoder: msgspec.json.Decoder, body: bytes) -> Any:
+    """Decode a JSON request body, reporting failures as FastAPI 422 errors."""
+    try:
+        return decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        )
+
+
+def openapi_request_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """`openapi_extra` documenting a raw-body route with a Pydantic model's schema."""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
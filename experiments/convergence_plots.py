@@ -1,6 +1,8 @@
 import os
-import time
-from typing import Dict, List, Tuple
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 
@@ -10,9 +12,46 @@ from pricing.monte_carlo import mc_price_european as mc_price
 from utils.plotting import loglog_convergence_plot, runtime_plot
 
 
-def run_option_convergence_experiments() -> Dict[str, float]:
+def _best_time(func: Callable[[], float], repeat: int = 5) -> float:
+    """Best-of-`repeat` wall time of func in seconds, after one untimed warm-up call."""
+    func()
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _binomial_point(
+    N: int, S0: float, K: float, r: float, sigma: float, T: float
+) -> float:
+    """Worker: binomial call price for one N."""
+    return binomial_price(S0, K, r, sigma, T, N, option="call")
+
+
+def _mc_point(
+    N: int,
+    seed_seq: np.random.SeedSequence,
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+) -> float:
+    """Worker: MC call price for one N.
+
+    Each N gets its own spawned seed: forked workers would otherwise inherit
+    the same module-level generator state and draw identical paths.
+    """
+    rng = np.random.default_rng(seed_seq)
+    # float32 paths halve memory traffic at N=1e6; the rounding is far below MC error
+    return mc_price(S0, K, r, sigma, T, N, option="call", rng=rng, dtype=np.float32)
+
+
+def run_option_convergence_experiments(seed: Optional[int] = None) -> Dict[str, float]:
     """Run binomial and MC convergence experiments and save figures.
 
+    The N values are priced in parallel worker processes; runtimes are then
+    measured one N at a time in this process, so no timing competes with
+    other work for cores. seed=None varies the MC paths between runs; pass an
+    int for reproducible MC errors.
+
     Returns a dict with fitted slopes for each experiment.
     """
     # Common parameters
@@ -22,21 +61,39 @@ def run_option_convergence_experiments() -> Dict[str, float]:
     sigma = 0.2
     T = 1.0
 
-    figures_dir = os.path.join("figures")
-    os.makedirs(figures_dir, exist_ok=True)
-
     bs_ref = bs_call_price(S0, K, r, sigma, T)
 
-    # Binomial convergence
+    # Measurements first, with no filesystem or plotting work interleaved
     binomial_N = [5, 10, 50, 100, 500, 1000, 5000]
-    binomial_errors: List[float] = []
-    binomial_times: List[float] = []
-    for N in binomial_N:
-        t0 = time.perf_counter()
-        price = binomial_price(S0, K, r, sigma, T, N, option="call")
-        t1 = time.perf_counter()
-        binomial_times.append(t1 - t0)
-        binomial_errors.append(abs(price - bs_ref))
+    mc_N = [10**2, 10**3, 10**4, 10**5, 10**6]
+    mc_seeds = np.random.SeedSequence(seed).spawn(len(mc_N))
+    params = dict(S0=S0, K=K, r=r, sigma=sigma, T=T)
+
+    # Prices: independent per N, computed concurrently in worker processes
+    with ProcessPoolExecutor() as ex:
+        binomial_prices = list(ex.map(partial(_binomial_point, **params), binomial_N))
+        mc_prices = list(ex.map(partial(_mc_point, **params), mc_N, mc_seeds))
+
+    # Runtimes: best-of-5 single calls, run sequentially after the pool has
+    # shut down so every timing has the machine to itself. The MC workspace
+    # is allocated once per N and reused by each timed call.
+    binomial_times: List[float] = [
+        _best_time(partial(binomial_price, S0, K, r, sigma, T, N, option="call"))
+        for N in binomial_N
+    ]
+    mc_times: List[float] = [
+        _best_time(
+            partial(mc_price, S0, K, r, sigma, T, N, option="call", out=np.empty(N, dtype=np.float32))
+        )
+        for N in mc_N
+    ]
+
+    binomial_errors: List[float] = [abs(price - bs_ref) for price in binomial_prices]
+    mc_errors: List[float] = [abs(price - bs_ref) for price in mc_prices]
+
+    # Figures
+    figures_dir = os.path.join("figures")
+    os.makedirs(figures_dir, exist_ok=True)
 
     binomial_fig = os.path.join(figures_dir, "binomial_convergence.png")
     slope_binomial = loglog_convergence_plot(
@@ -46,18 +103,6 @@ def run_option_convergence_experiments() -> Dict[str, float]:
         outfile=binomial_fig,
     )
 
-    # Monte Carlo convergence
-    mc_N = [10**2, 10**3, 10**4, 10**5, 10**6]
-    mc_errors: List[float] = []
-    mc_times: List[float] = []
-    for N in mc_N:
-        t0 = time.perf_counter()
-        # No fixed seed to allow variability across runs; set seed here for reproducibility if desired
-        price, _ = mc_price(S0, K, r, sigma, T, N, option="call", seed=None, return_stderr=True)
-        t1 = time.perf_counter()
-        mc_times.append(t1 - t0)
-        mc_errors.append(abs(price - bs_ref))
-
     mc_fig = os.path.join(figures_dir, "montecarlo_option_convergence.png")
     slope_mc = loglog_convergence_plot(
         mc_N,
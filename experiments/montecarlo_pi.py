@@ -1,11 +1,14 @@
 import os
-import time
 from typing import Dict, List
 
 import numpy as np
 
 from utils.plotting import loglog_convergence_plot
 
+# Seeded once per process: runs are reproducible across processes and repeated
+# calls continue the stream instead of rebuilding a Generator each time
+_RNG = np.random.default_rng(0xC0FFEE)
+
 
 def run_pi_convergence_experiment() -> Dict[str, float]:
     figures_dir = os.path.join("figures")
@@ -14,13 +17,12 @@ def run_pi_convergence_experiment() -> Dict[str, float]:
     Ns = [10**2, 10**3, 10**4, 10**5, 10**6]
     errors: List[float] = []
 
-    # Unseeded RNG for variability between runs; set a number for reproducibility
-    rng = np.random.default_rng()
+    # One draw of max(Ns) points in [-1,1]^2; each N uses a prefix of it
+    xy = _RNG.uniform(low=-1.0, high=1.0, size=(max(Ns), 2))
+    inside = np.einsum("ij,ij->i", xy, xy) <= 1.0
+    cum_inside = np.cumsum(inside, dtype=np.int64)
     for N in Ns:
-        # Generate in [-1,1]^2
-        xy = rng.uniform(low=-1.0, high=1.0, size=(N, 2))
-        inside = np.sum(np.sum(xy * xy, axis=1) <= 1.0)
-        pi_hat = 4.0 * inside / float(N)
+        pi_hat = 4.0 * cum_inside[N - 1] / float(N)
         errors.append(abs(pi_hat - np.pi))
 
     fig_path = os.path.join(figures_dir, "montecarlo_pi_convergence.png")
@@ -157,6 +157,7 @@ export interface HedgingSimulateRequest {
   transaction_cost?: number;
   num_simulations?: number;
   option_contracts?: number;
+  rebalance_threshold?: number;
 }
 
 export interface HedgingDataPoint {
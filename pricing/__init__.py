@@ -8,29 +8,58 @@ Modules:
 - delta_hedging: Delta hedging simulation
 """
 
-from .black_scholes import call_price as bs_call_price, put_price as bs_put_price
-from .binomial import price_european as binomial_price
-from .monte_carlo import mc_price_european as mc_price
-from .greeks import (
-    delta,
-    gamma,
-    theta,
-    vega,
-    rho,
-    calculate_all_greeks,
-)
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562), so a bare `import pricing` stays cheap and loads scipy or
+# numba only when a name that needs them is used. (The API still loads them
+# at startup, since its routers import pricing names at module level.)
+_EXPORTS = {
+    "bs_call_price": ("black_scholes", "call_price"),
+    "bs_put_price": ("black_scholes", "put_price"),
+    "binomial_price": ("binomial", "price_european"),
+    "binomial_price_steps": ("binomial", "price_european_steps"),
+    "binomial_price_spots": ("binomial", "price_european_spots"),
+    "mc_price": ("monte_carlo", "mc_price_european"),
+    "mc_price_prefixes": ("monte_carlo", "mc_price_european_prefixes"),
+    "delta": ("greeks", "delta"),
+    "gamma": ("greeks", "gamma"),
+    "theta": ("greeks", "theta"),
+    "vega": ("greeks", "vega"),
+    "rho": ("greeks", "rho"),
+    "Greeks": ("greeks", "Greeks"),
+    "calculate_all_greeks": ("greeks", "calculate_all_greeks"),
+    "calculate_all_greeks_vec": ("greeks", "calculate_all_greeks_vec"),
+}
 
 __all__ = [
     "bs_call_price",
     "bs_put_price",
     "binomial_price",
+    "binomial_price_steps",
+    "binomial_price_spots",
     "mc_price",
+    "mc_price_prefixes",
     "delta",
     "gamma",
     "theta",
     "vega",
     "rho",
+    "Greeks",
     "calculate_all_greeks",
+    "calculate_all_greeks_vec",
 ]
 
 
+def __getattr__(name):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,120 @@
+"""Numba kernels for the CRR binomial pricer.
+
+Importing this module requires numba; pricing.binomial falls back to its
+NumPy implementation when the import fails.
+"""
+
+import math
+
+import numpy as np
+from numba import guvectorize, njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def binomial_price_nb(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    N: int,
+    is_call: bool,
+) -> float:
+    """Closed-form CRR price as one scalar pass over terminal nodes."""
+    dt = T / N
+    log_u = sigma * math.sqrt(dt)
+    u = math.exp(log_u)
+    d = 1.0 / u
+    p = (math.exp(r * dt) - d) / (u - d)
+    p = min(1.0, max(0.0, p))
+
+    # Degenerate tree: all risk-neutral mass sits on one terminal node
+    if p == 0.0 or p == 1.0:
+        j = N if p == 1.0 else 0
+        S_T = S0 * math.exp((2 * j - N) * log_u)
+        payoff = max(S_T - K, 0.0) if is_call else max(K - S_T, 0.0)
+        return math.exp(-r * T) * payoff
+
+    log_p = math.log(p)
+    log_q = math.log1p(-p)
+    log_n_fact = math.lgamma(N + 1.0)
+
+    # Sum of binomial probabilities times terminal payoffs (log-space pmf)
+    total = 0.0
+    for j in range(N + 1):
+        S_T = S0 * math.exp((2 * j - N) * log_u)
+        payoff = max(S_T - K, 0.0) if is_call else max(K - S_T, 0.0)
+        if payoff > 0.0:
+            log_pmf = (
+                log_n_fact
+                - math.lgamma(j + 1.0)
+                - math.lgamma(N - j + 1.0)
+                + j * log_p
+                + (N - j) * log_q
+            )
+            total += math.exp(log_pmf) * payoff
+
+    return math.exp(-r * T) * total
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def binomial_price_spots_nb(S0s, K, r, sigma, T, N, is_call):
+    """CRR prices for several spots on one tree, sharing the pmf across them.
+
+    The tree's factors and probabilities depend only on (r, sigma, T, N), and
+    terminal prices scale linearly in S0, so each node's pmf is evaluated
+    once and applied to every spot.
+    """
+    dt = T / N
+    log_u = sigma * math.sqrt(dt)
+    u = math.exp(log_u)
+    d = 1.0 / u
+    p = (math.exp(r * dt) - d) / (u - d)
+    p = min(1.0, max(0.0, p))
+    disc = math.exp(-r * T)
+    out = np.zeros(S0s.shape[0])
+
+    # Degenerate tree: all risk-neutral mass sits on one terminal node
+    if p == 0.0 or p == 1.0:
+        j = N if p == 1.0 else 0
+        for k in range(S0s.shape[0]):
+            S_T = S0s[k] * math.exp((2 * j - N) * log_u)
+            payoff = max(S_T - K, 0.0) if is_call else max(K - S_T, 0.0)
+            out[k] = disc * payoff
+        return out
+
+    log_p = math.log(p)
+    log_q = math.log1p(-p)
+    log_n_fact = math.lgamma(N + 1.0)
+
+    for j in range(N + 1):
+        growth = math.exp((2 * j - N) * log_u)
+        pmf = -1.0  # evaluated on the first in-the-money spot only
+        for k in range(S0s.shape[0]):
+            S_T = S0s[k] * growth
+            payoff = max(S_T - K, 0.0) if is_call else max(K - S_T, 0.0)
+            if payoff > 0.0:
+                if pmf < 0.0:
+                    pmf = math.exp(
+                        log_n_fact
+                        - math.lgamma(j + 1.0)
+                        - math.lgamma(N - j + 1.0)
+                        + j * log_p
+                        + (N - j) * log_q
+                    )
+                out[k] += pmf * payoff
+
+    for k in range(S0s.shape[0]):
+        out[k] *= disc
+    return out
+
+
+@guvectorize(
+    ["void(float64, float64, float64, float64, float64, int64, boolean, float64[:])"],
+    "(),(),(),(),(),(),()->()",
+    nopython=True,
+    cache=True,
+)
+def binomial_price_gu(S0, K, r, sigma, T, N, is_call, out):
+    """Broadcasting ufunc over the CRR kernel (e.g. across step counts)."""
+    out[0] = binomial_price_nb(S0, K, r, sigma, T, N, is_call)
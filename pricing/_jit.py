@@ -0,0 +1,57 @@
+"""Optional Numba support for the pricing kernels.
+
+numba is listed in requirements.txt, but the pricing package stays importable
+without it: `jit` then returns functions unchanged and `prange` is `range`,
+so the kernels run as plain Python.
+
+Parallel kernels are called from API worker threads, and numba's fallback
+workqueue layer aborts the process when two threads enter a parallel region
+at once. The threading layer is therefore pinned to a threadsafe one (OpenMP
+first, then TBB, which is in requirements.txt), and kernels pass
+`parallel=PARALLEL` so they compile serially when neither is installed.
+"""
+
+import importlib
+from typing import Optional
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    numba = None
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _threadsafe_layer() -> Optional[str]:
+    """First loadable threadsafe layer, OpenMP before TBB (or None).
+
+    OpenMP is preferred because a TBB pool started off the main thread keeps
+    the interpreter from exiting. This overrides NUMBA_THREADING_LAYER, since
+    workqueue is unsafe here and tbb hangs at shutdown.
+    """
+    for layer in ("omp", "tbb"):
+        try:
+            importlib.import_module(f"numba.np.ufunc.{layer}pool")
+        except ImportError:
+            continue
+        return layer
+    return None
+
+
+_LAYER = _threadsafe_layer() if NUMBA_AVAILABLE else None
+if _LAYER is not None:
+    # Must be set before the first parallel kernel launches its thread pool
+    numba.config.THREADING_LAYER = _LAYER
+
+# Use for the `parallel=` option of every prange kernel
+PARALLEL = _LAYER is not None
+
+
+def jit(**options):
+    """Decorator applying `numba.njit(**options)` when numba is installed."""
+    if njit is None:
+        return lambda func: func
+    return njit(**options)
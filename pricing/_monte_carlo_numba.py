@@ -0,0 +1,46 @@
+"""Numba kernels for the Monte Carlo pricer.
+
+Importing this module requires numba; pricing.monte_carlo falls back to its
+NumPy implementation when the import fails.
+"""
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def payoff_sums_nb(Z, S0, K, drift, vol, is_call, antithetic, forward):
+    """Payoff and control-variate sums in one fused pass over Z.
+
+    Each normal z maps to S_T = S0 * exp(drift + vol * z). With antithetic,
+    each sample is the average of the payoffs (and of the S_T) for z and -z.
+    The control is x = S_T - forward, i.e. S_T centred on its known mean.
+
+    Serial by design: callers (API handlers, worker threads) already run
+    concurrently, and a parallel region launched from several threads is
+    not safe under numba's default workqueue layer.
+
+    Returns (sum y, sum y^2, sum x, sum x^2, sum xy) over the len(Z) samples.
+    """
+    s_y = 0.0
+    s_yy = 0.0
+    s_x = 0.0
+    s_xx = 0.0
+    s_xy = 0.0
+    for i in range(Z.shape[0]):
+        diffusion = vol * Z[i]
+        ST = S0 * math.exp(drift + diffusion)
+        y = max(ST - K, 0.0) if is_call else max(K - ST, 0.0)
+        x = ST
+        if antithetic:
+            ST = S0 * math.exp(drift - diffusion)
+            y = 0.5 * (y + (max(ST - K, 0.0) if is_call else max(K - ST, 0.0)))
+            x = 0.5 * (x + ST)
+        x -= forward
+        s_y += y
+        s_yy += y * y
+        s_x += x
+        s_xx += x * x
+        s_xy += x * y
+    return s_y, s_yy, s_x, s_xx, s_xy
@@ -1,12 +1,65 @@
+import functools
 import math
-from typing import Literal
+from typing import Literal, Sequence, Tuple
 
 import numpy as np
+from scipy.special import gammaln, xlog1py, xlogy
+
+try:
+    from ._binomial_numba import binomial_price_gu as _binomial_price_gu
+    from ._binomial_numba import binomial_price_nb as _binomial_price_nb
+    from ._binomial_numba import binomial_price_spots_nb as _binomial_price_spots_nb
+except ImportError:  # numba is optional; fall back to the NumPy implementation
+    _binomial_price_gu = None
+    _binomial_price_nb = None
+    _binomial_price_spots_nb = None
 
 
 OptionType = Literal["call", "put"]
 
 
+@functools.lru_cache(maxsize=256)
+def _crr_params(r: float, sigma: float, dt: float) -> Tuple[float, float]:
+    """CRR log up-factor and (clipped) risk-neutral up probability for a step dt."""
+    log_u = sigma * math.sqrt(dt)
+    u = math.exp(log_u)
+    d = 1.0 / u
+    p = (math.exp(r * dt) - d) / (u - d)
+    if not (0 <= p <= 1):
+        p = min(1.0, max(0.0, p))
+    return log_u, p
+
+
+def _make_pricer(is_call: bool):
+    """NumPy CRR pricer specialized for calls or puts, built once at import."""
+    sign = 1.0 if is_call else -1.0
+
+    def _price(S0: float, K: float, r: float, sigma: float, T: float, N: int) -> float:
+        log_u, p = _crr_params(r, sigma, T / N)
+
+        # Asset prices at maturity: S0 * u**j * d**(N-j) = S0 * exp((2j - N) log u)
+        j = np.arange(N + 1)
+        S_T = S0 * np.exp((2 * j - N) * log_u)
+
+        # Payoff computed in place in the S_T buffer: max(sign * (S_T - K), 0)
+        V = np.subtract(S_T, K, out=S_T)
+        V *= sign
+        np.maximum(V, 0.0, out=V)
+
+        # Backward induction collapses to the discounted expectation under the
+        # risk-neutral binomial distribution; evaluate its pmf in log space
+        log_pmf = (
+            gammaln(N + 1) - gammaln(j + 1) - gammaln(N - j + 1)
+            + xlogy(j, p) + xlog1py(N - j, -p)
+        )
+        return float(math.exp(-r * T) * np.dot(np.exp(log_pmf), V))
+
+    return _price
+
+
+_NUMPY_PRICERS = {"call": _make_pricer(True), "put": _make_pricer(False)}
+
+
 def price_european(
     S0: float,
     K: float,
@@ -24,30 +77,112 @@ def price_european(
         raise ValueError("N must be positive")
     if sigma <= 0 or T <= 0:
         raise ValueError("sigma and T must be positive")
+    if option not in ("call", "put"):
+        raise ValueError("option must be 'call' or 'put'")
 
-    dt = T / N
-    u = math.exp(sigma * math.sqrt(dt))
-    d = 1.0 / u
-    disc = math.exp(-r * dt)
-    p = (math.exp(r * dt) - d) / (u - d)
-    if not (0 <= p <= 1):
-        p = min(1.0, max(0.0, p))
+    if _binomial_price_nb is not None:
+        return float(_binomial_price_nb(S0, K, r, sigma, T, N, option == "call"))
 
-    # Asset prices at maturity
-    j = np.arange(N + 1)
-    S_T = S0 * (u ** j) * (d ** (N - j))
+    return _NUMPY_PRICERS[option](S0, K, r, sigma, T, N)
+
+
+def price_european_steps(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    Ns: Sequence[int],
+    option: OptionType = "call",
+) -> np.ndarray:
+    """Price one European option for several tree sizes in a single call.
+
+    Returns an array with the CRR price for each N in Ns.
+    """
+    Ns = np.asarray(Ns, dtype=np.int64)
+    if np.any(Ns <= 0):
+        raise ValueError("N must be positive")
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+    if option not in ("call", "put"):
+        raise ValueError("option must be 'call' or 'put'")
+
+    if _binomial_price_gu is not None:
+        return _binomial_price_gu(
+            float(S0), float(K), float(r), float(sigma), float(T), Ns, option == "call"
+        )
+
+    return np.array([price_european(S0, K, r, sigma, T, int(N), option) for N in Ns])
 
-    if option == "call":
-        V = np.maximum(S_T - K, 0.0)
-    elif option == "put":
-        V = np.maximum(K - S_T, 0.0)
-    else:
+
+def price_european_spots(
+    S0s: Sequence[float],
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    N: int,
+    option: OptionType = "call",
+) -> np.ndarray:
+    """Price one European option on a single N-step tree for several spots.
+
+    u, d, p and the discount depend only on (r, sigma, T, N) and terminal
+    prices scale linearly in S0, so the binomial weights are computed once
+    and shared by every spot.
+
+    Returns an array with the CRR price for each S0 in S0s.
+    """
+    S0s = np.asarray(S0s, dtype=float)
+    if N <= 0:
+        raise ValueError("N must be positive")
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+    if option not in ("call", "put"):
         raise ValueError("option must be 'call' or 'put'")
 
-    # Backward induction
-    for _ in range(N, 0, -1):
-        V = disc * (p * V[1:] + (1 - p) * V[:-1])
+    if _binomial_price_spots_nb is not None:
+        return _binomial_price_spots_nb(
+            S0s, float(K), float(r), float(sigma), float(T), int(N), option == "call"
+        )
 
-    return float(V[0])
+    log_u, p = _crr_params(r, sigma, T / N)
+    j = np.arange(N + 1)
+    pmf = np.exp(
+        gammaln(N + 1) - gammaln(j + 1) - gammaln(N - j + 1)
+        + xlogy(j, p) + xlog1py(N - j, -p)
+    )
+    # One row of terminal payoffs per spot
+    V = np.multiply.outer(S0s, np.exp((2 * j - N) * log_u))
+    V -= K
+    if option == "put":
+        np.negative(V, out=V)
+    np.maximum(V, 0.0, out=V)
+    return math.exp(-r * T) * (V @ pmf)
 
 
+def step_two_nodes(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    N: int,
+    option: OptionType = "call",
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """Spots and option values at the three time-2*dt nodes of an N-step tree.
+
+    Each node value is the (N-2)-step CRR price from that node over T - 2*dt,
+    which is exactly the value backward induction assigns it. Requires N >= 3.
+
+    Returns ((S_uu, S_ud, S_dd), (V_uu, V_ud, V_dd)).
+    """
+    if N < 3:
+        raise ValueError("N must be at least 3")
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+
+    dt = T / N
+    log_u, _ = _crr_params(r, sigma, dt)
+    spots = (S0 * math.exp(2.0 * log_u), S0, S0 * math.exp(-2.0 * log_u))
+    V_uu, V_ud, V_dd = price_european_spots(spots, K, r, sigma, T - 2.0 * dt, N - 2, option)
+    return spots, (float(V_uu), float(V_ud), float(V_dd))
@@ -1,8 +1,7 @@
+import functools
 import math
 from dataclasses import dataclass
-
-import numpy as np
-from scipy.stats import norm
+from typing import Tuple
 
 
 @dataclass(frozen=True)
@@ -14,6 +13,11 @@ class BSParams:
     T: float
 
 
+def _Phi(x: float) -> float:
+    """Standard normal CDF for a scalar via math.erf."""
+    return 0.5 * (1.0 + math.erf(x * 0.7071067811865476))
+
+
 def _d1(S0: float, K: float, r: float, sigma: float, T: float) -> float:
     if sigma <= 0 or T <= 0:
         raise ValueError("sigma and T must be positive for Black–Scholes")
@@ -24,16 +28,30 @@ def _d2(d1: float, sigma: float, T: float) -> float:
     return d1 - sigma * math.sqrt(T)
 
 
+# Reference prices recur across requests (e.g. the convergence anchor while a
+# UI slider is dragged), so both pricers are memoized on their float inputs
+@functools.lru_cache(maxsize=2048)
 def call_price(S0: float, K: float, r: float, sigma: float, T: float) -> float:
     d1 = _d1(S0, K, r, sigma, T)
     d2 = _d2(d1, sigma, T)
-    return S0 * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
+    return S0 * _Phi(d1) - K * math.exp(-r * T) * _Phi(d2)
 
 
+@functools.lru_cache(maxsize=2048)
 def put_price(S0: float, K: float, r: float, sigma: float, T: float) -> float:
     d1 = _d1(S0, K, r, sigma, T)
     d2 = _d2(d1, sigma, T)
-    return K * math.exp(-r * T) * norm.cdf(-d2) - S0 * norm.cdf(-d1)
+    return K * math.exp(-r * T) * _Phi(-d2) - S0 * _Phi(-d1)
+
+
+def _prices(S0: float, K: float, r: float, sigma: float, T: float) -> Tuple[float, float]:
+    """Call and put from one d1/d2 evaluation; the put follows from put-call parity."""
+    d1 = _d1(S0, K, r, sigma, T)
+    d2 = _d2(d1, sigma, T)
+    disc_K = K * math.exp(-r * T)
+    call = S0 * _Phi(d1) - disc_K * _Phi(d2)
+    put = call - S0 + disc_K
+    return call, put
 
 
 def bs_test_case() -> dict:
@@ -46,8 +64,7 @@ def bs_test_case() -> dict:
     r = 0.05
     sigma = 0.2
     T = 1.0
-    c = call_price(S0, K, r, sigma, T)
-    p = put_price(S0, K, r, sigma, T)
+    c, p = _prices(S0, K, r, sigma, T)
     return {"call": c, "put": p}
 
 
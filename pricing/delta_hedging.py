@@ -4,14 +4,22 @@ This module simulates daily delta hedging for either a long call option or a lon
 given the ability to trade the underlying asset but not immediately sell the option.
 """
 
+import functools
 import math
 from typing import Literal, Optional, Tuple
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr, ndtri
+
+from ._jit import PARALLEL, jit, prange
 
 OptionType = Literal["call", "put"]
 
+# Shared generator for unseeded paths, so each call does not construct and
+# seed a new one. Seeded paths keep default_rng(seed) (PCG64), which
+# hedging_analysis reproduces for its per-simulation streams.
+_RNG = np.random.Generator(np.random.PCG64DXSM())
+
 
 def black_scholes_price(S: float, K: float, r: float, sigma: float, tau: float, option_type: OptionType) -> float:
     """Calculate Black-Scholes option price.
@@ -41,9 +49,9 @@ def black_scholes_price(S: float, K: float, r: float, sigma: float, tau: float,
     d2 = d1 - sigma * math.sqrt(tau)
     
     if option_type == "call":
-        return S * norm.cdf(d1) - K * math.exp(-r * tau) * norm.cdf(d2)
+        return S * ndtr(d1) - K * math.exp(-r * tau) * ndtr(d2)
     else:  # put
-        return K * math.exp(-r * tau) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        return K * math.exp(-r * tau) * ndtr(-d2) - S * ndtr(-d1)
 
 
 def black_scholes_delta(S: float, K: float, r: float, sigma: float, tau: float, option_type: OptionType) -> float:
@@ -73,12 +81,295 @@ def black_scholes_delta(S: float, K: float, r: float, sigma: float, tau: float,
     d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * math.sqrt(tau))
     
     if option_type == "call":
-        return norm.cdf(d1)
+        return ndtr(d1)
+    else:  # put
+        return ndtr(d1) - 1.0
+
+
+def _bs_price_delta_vector(
+    S: np.ndarray, K: float, r: float, sigma: float, tau: np.ndarray, option_type: OptionType
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Black-Scholes prices and deltas for arrays of stock prices and maturities.
+    
+    Vectorized counterpart of `black_scholes_price`/`black_scholes_delta`;
+    entries with tau == 0 get the same expiration values as those functions.
+    
+    Args:
+        S: Stock prices
+        K: Strike price
+        r: Risk-free rate
+        sigma: Volatility
+        tau: Times to maturity (T - t), same shape as S
+        option_type: 'call' or 'put'
+    
+    Returns:
+        Tuple of (prices, deltas)
+    """
+    if sigma <= 0 or np.any(tau < 0):
+        raise ValueError("sigma and tau must be positive for Black-Scholes")
+    
+    live = tau > 0
+    tau_live = np.where(live, tau, 1.0)  # placeholder keeps expired entries finite
+    sqrt_tau = np.sqrt(tau_live)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * tau_live) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    disc_K = K * np.exp(-r * tau_live)
+    
+    if option_type == "call":
+        prices = np.where(live, S * ndtr(d1) - disc_K * ndtr(d2), np.maximum(0.0, S - K))
+        deltas = np.where(live, ndtr(d1), (S > K).astype(float))
     else:  # put
-        return norm.cdf(d1) - 1.0
+        prices = np.where(live, disc_K * ndtr(-d2) - S * ndtr(-d1), np.maximum(0.0, K - S))
+        deltas = np.where(live, ndtr(d1) - 1.0, -(S < K).astype(float))
+    return prices, deltas
+
+
+@jit(cache=True, nogil=True)
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via erfc (usable inside Numba kernels)."""
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+@jit(cache=True, nogil=True)
+def _bs_price_and_delta(S: float, K: float, r: float, sigma: float, tau: float, is_call: bool) -> Tuple[float, float]:
+    """Black-Scholes price and delta for tau > 0 from one d1/d2 evaluation."""
+    sqrt_tau = math.sqrt(tau)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    disc = math.exp(-r * tau)
+    if is_call:
+        Nd1 = _norm_cdf(d1)
+        return S * Nd1 - K * disc * _norm_cdf(d2), Nd1
+    return K * disc * _norm_cdf(-d2) - S * _norm_cdf(-d1), _norm_cdf(d1) - 1.0
+
+
+@jit(cache=True, nogil=True)
+def _simulate_one_path(
+    Z: np.ndarray,
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    is_call: bool,
+    transaction_cost: float,
+    total_shares_underlying: float,
+    initial_option_position: float,
+    rebalance_threshold: float,
+) -> Tuple[float, float, float]:
+    """Compiled single-path delta hedge returning only the summary figures.
+    
+    Mirrors `run_delta_hedge` for a path driven by the normals `Z` (one per
+    step) without building any time series.
+    
+    Returns:
+        Tuple of (total_pnl, total_transaction_cost, replication_error)
+    """
+    N = Z.shape[0]
+    dt = T / N
+    drift = (r - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    growth = math.exp(r * dt)
+    scale = total_shares_underlying * initial_option_position
+    
+    S = S0
+    price, delta = _bs_price_and_delta(S, K, r, sigma, T, is_call)
+    option_value = price * scale
+    option_delta = delta * initial_option_position
+    
+    hedge = -option_delta * total_shares_underlying
+    cash = -option_value - hedge * S
+    initial_trade_cost = 0.0
+    if abs(hedge) > 1e-10:
+        initial_trade_cost = abs(hedge) * S * transaction_cost
+        cash -= initial_trade_cost
+    initial_portfolio_value = option_value + hedge * S + cash
+    cumulative_transaction_cost = initial_trade_cost
+    
+    for i in range(1, N + 1):
+        S = S * math.exp(drift + vol * Z[i - 1])
+        tau = 0.0 if i == N else max(0.0, T - i * dt)
+        
+        if tau > 0:
+            price, delta = _bs_price_and_delta(S, K, r, sigma, tau, is_call)
+            option_value = price * scale
+            option_delta = delta * initial_option_position
+        else:
+            # At expiration (same conventions as run_delta_hedge)
+            if is_call:
+                option_value = max(0.0, S - K) * scale
+                in_the_money = S > K
+            else:
+                option_value = max(0.0, K - S) * scale
+                in_the_money = S < K
+            option_delta = (1.0 if in_the_money else 0.0) * initial_option_position
+        
+        required_hedge = -option_delta * total_shares_underlying
+        cash *= growth
+        hedge_adjustment = required_hedge - hedge
+        if abs(hedge_adjustment) > rebalance_threshold:
+            cash -= hedge_adjustment * S
+            if abs(hedge_adjustment) > 1e-10:
+                trade_cost = abs(hedge_adjustment) * S * transaction_cost
+                cumulative_transaction_cost += trade_cost
+                cash -= trade_cost
+            hedge = required_hedge
+    
+    final_portfolio_value = option_value + hedge * S + cash
+    replication_error = option_value + cash + hedge * S
+    return (
+        final_portfolio_value - initial_portfolio_value,
+        cumulative_transaction_cost,
+        replication_error,
+    )
+
+
+@jit(cache=True, nogil=True, parallel=PARALLEL)
+def _simulate_paths_nb(
+    Z: np.ndarray,
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    is_call: bool,
+    transaction_cost: float,
+    total_shares_underlying: float,
+    initial_option_position: float,
+    rebalance_threshold: float,
+) -> np.ndarray:
+    """Run `_simulate_one_path` for every row of `Z` in parallel.
+    
+    Returns:
+        Array of shape (num_paths, 3) holding
+        (total_pnl, total_transaction_cost, replication_error) per path
+    """
+    num_paths = Z.shape[0]
+    results = np.empty((num_paths, 3))
+    for p in prange(num_paths):
+        pnl, tc, err = _simulate_one_path(
+            Z[p],
+            S0,
+            K,
+            r,
+            sigma,
+            T,
+            is_call,
+            transaction_cost,
+            total_shares_underlying,
+            initial_option_position,
+            rebalance_threshold,
+        )
+        results[p, 0] = pnl
+        results[p, 1] = tc
+        results[p, 2] = err
+    return results
+
+
+@jit(cache=True, nogil=True)
+def _hedge_loop(
+    stock_prices: np.ndarray,
+    deltas: np.ndarray,
+    initial_option_value: float,
+    dt: float,
+    r: float,
+    transaction_cost: float,
+    total_shares_underlying: float,
+    rebalance_threshold: float,
+) -> Tuple[np.ndarray, np.ndarray, float, float, float]:
+    """Compiled cash and hedge bookkeeping for `run_delta_hedge`.
+    
+    Args:
+        stock_prices: Stock prices S_0..S_N
+        deltas: Option deltas (already scaled by the option position)
+        initial_option_value: Option value at t=0
+        dt: Time step between rebalances (years)
+        r: Risk-free rate
+        transaction_cost: Transaction cost as fraction
+        total_shares_underlying: Shares covered by the option position
+        rebalance_threshold: Hedge changes of at most this many shares are skipped
+    
+    Returns:
+        Tuple of (hedge_positions, cash_balances, hedging_pnl,
+        cumulative_transaction_cost, initial_trade_cost)
+    """
+    N = stock_prices.shape[0] - 1
+    # Every slot is written below, so skip zero-filling
+    hedge_positions = np.empty(N + 1)
+    cash_balances = np.empty(N + 1)
+    
+    # Initial hedge position: H_0 = -Δ_0 × (option position)
+    # Since we're long the option, we take the opposite delta in the underlying
+    hedge_positions[0] = -deltas[0] * total_shares_underlying
+    
+    # Initial cash: pay for option, receive from hedge
+    # cash_0 = -initial_option_price - H_0 * S_0
+    cash_balances[0] = -initial_option_value - hedge_positions[0] * stock_prices[0]
+    
+    # Pay transaction cost on initial hedge
+    initial_trade_cost = 0.0
+    if abs(hedge_positions[0]) > 1e-10:
+        initial_trade_cost = abs(hedge_positions[0]) * stock_prices[0] * transaction_cost
+        cash_balances[0] -= initial_trade_cost
+    
+    # Track hedging P&L: Σ[H_{t-1}(S_t - S_{t-1})]
+    hedging_pnl = 0.0
+    cumulative_transaction_cost = initial_trade_cost
+    
+    # Track cash without interest for interest calculation
+    cash_without_interest = cash_balances[0]
+    
+    # One step of interest on cash (loop invariant)
+    growth = math.exp(r * dt)
+    
+    for i in range(1, N + 1):
+        S_t = stock_prices[i]
+        
+        # Determine hedge position needed: H_t = -Δ_t × (option position)
+        required_hedge = -deltas[i] * total_shares_underlying
+        
+        # Apply interest on cash before rebalancing
+        cash = cash_balances[i - 1] * growth
+        
+        # Adjust hedge by trading underlying: ΔH_t = H_t - H_{t-1}
+        hedge_adjustment = required_hedge - hedge_positions[i - 1]
+        
+        if abs(hedge_adjustment) > rebalance_threshold:
+            # Update cash: cash_t = cash_{t-1} - ΔH_t * S_t
+            # (buying underlying reduces cash, selling increases)
+            cash -= hedge_adjustment * S_t
+            cash_without_interest -= hedge_adjustment * S_t
+            
+            # Pay transaction cost
+            if abs(hedge_adjustment) > 1e-10:
+                trade_cost = abs(hedge_adjustment) * S_t * transaction_cost
+                cumulative_transaction_cost += trade_cost
+                cash -= trade_cost
+                cash_without_interest -= trade_cost
+        else:
+            # Inside the no-trade band: keep the previous hedge
+            required_hedge = hedge_positions[i - 1]
+        
+        cash_balances[i] = cash
+        hedge_positions[i] = required_hedge
+        hedging_pnl += hedge_positions[i - 1] * (S_t - stock_prices[i - 1])
+    
+    # Add interest on cash to hedging P&L
+    # Interest earned = final_cash (with interest) - final_cash (without interest)
+    hedging_pnl += cash_balances[N] - cash_without_interest
+    
+    return hedge_positions, cash_balances, hedging_pnl, cumulative_transaction_cost, initial_trade_cost
 
 
-def simulate_path(S0: float, r: float, sigma: float, T: float, dt: float, seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+def simulate_path(
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    dt: float,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
     """Generate a single stock price path using geometric Brownian motion.
     
     Formula: S_{t+Δt} = S_t * exp((r - 0.5*σ²)Δt + σ√Δt*Z) where Z ~ N(0,1)
@@ -90,31 +381,31 @@ def simulate_path(S0: float, r: float, sigma: float, T: float, dt: float, seed:
         T: Time to maturity (years)
         dt: Time step (years)
         seed: Random seed (optional)
+        rng: Generator to draw from (optional; takes precedence over seed)
     
     Returns:
         Tuple of (time_points, stock_prices)
     """
-    if seed is not None:
-        rng = np.random.default_rng(seed)
-    else:
-        rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng(seed) if seed is not None else _RNG
     
     # Generate time points
     num_steps = int(math.ceil(T / dt))
     time_points = np.linspace(0, T, num_steps + 1)
     
     # Generate stock prices using GBM
-    Z = rng.standard_normal(size=num_steps)
+    Z = rng.standard_normal(size=num_steps, dtype=np.float64)
     dt_actual = T / num_steps if num_steps > 0 else dt
     
-    # Calculate stock prices: S_{t+Δt} = S_t * exp((r - 0.5*σ²)Δt + σ√Δt*Z)
-    stock_prices = np.zeros(num_steps + 1)
-    stock_prices[0] = S0
+    # Calculate stock prices: S_{t+Δt} = S_t * exp((r - 0.5*σ²)Δt + σ√Δt*Z),
+    # i.e. S_t = S0 * exp(cumulative sum of the log increments)
+    log_increments = (r - 0.5 * sigma * sigma) * dt_actual + sigma * math.sqrt(dt_actual) * Z
+    np.cumsum(log_increments, out=log_increments)
+    np.exp(log_increments, out=log_increments)
     
-    for i in range(num_steps):
-        stock_prices[i + 1] = stock_prices[i] * math.exp(
-            (r - 0.5 * sigma * sigma) * dt_actual + sigma * math.sqrt(dt_actual) * Z[i]
-        )
+    stock_prices = np.empty(num_steps + 1)
+    stock_prices[0] = S0
+    np.multiply(S0, log_increments, out=stock_prices[1:])
     
     return time_points, stock_prices
 
@@ -132,6 +423,7 @@ def run_delta_hedge(
     seed: Optional[int] = None,
     transaction_cost: float = 0.0,
     option_contracts: int = 1,
+    rebalance_threshold: float = 0.0,
 ) -> dict:
     """Run delta hedging simulation.
     
@@ -148,10 +440,16 @@ def run_delta_hedge(
         seed: Random seed for path generation
         transaction_cost: Transaction cost as fraction (e.g., 0.001 = 0.1%)
         option_contracts: Number of option contracts (100 shares per contract)
+        rebalance_threshold: Minimum hedge change (shares) worth trading; smaller
+            changes keep the previous hedge (band hedging). 0 rebalances every step
     
     Returns:
-        Dictionary with simulation results
+        Dictionary with simulation results. "time_series" and "transactions"
+        are structure-of-arrays tables (column name -> array/list of values).
     """
+    if rebalance_threshold < 0:
+        raise ValueError("rebalance_threshold must be non-negative")
+    
     # Scale by option contracts
     shares_per_contract = 100
     total_shares_underlying = option_contracts * shares_per_contract
@@ -172,96 +470,38 @@ def run_delta_hedge(
     # Calculate actual time step
     dt_actual = T / N if N > 0 else dt
     
-    # Initialize arrays
-    option_prices = np.zeros(N + 1)
-    deltas = np.zeros(N + 1)
-    hedge_positions = np.zeros(N + 1)
-    cash_balances = np.zeros(N + 1)
-    
-    # Initial option price and delta
-    tau_0 = T
-    option_prices[0] = black_scholes_price(S0, K, r, sigma, tau_0, option_type) * total_shares_underlying * initial_option_position
-    deltas[0] = black_scholes_delta(S0, K, r, sigma, tau_0, option_type) * initial_option_position
-    
-    # Initial hedge position: H_0 = -Δ_0 × (option position)
-    # Since we're long the option, we take the opposite delta in the underlying
-    hedge_positions[0] = -deltas[0] * total_shares_underlying
-    
-    # Initial cash: pay for option, receive from hedge
-    # cash_0 = -initial_option_price - H_0 * S_0
-    cash_balances[0] = -option_prices[0] - hedge_positions[0] * S0
-    
-    # Pay transaction cost on initial hedge
-    if abs(hedge_positions[0]) > 1e-10:
-        initial_trade_cost = abs(hedge_positions[0]) * S0 * transaction_cost
-        cash_balances[0] -= initial_trade_cost
-    else:
-        initial_trade_cost = 0.0
-    
-    # Track hedging P&L: Σ[H_{t-1}(S_t - S_{t-1})]
-    hedging_pnl = 0.0
-    cumulative_transaction_cost = initial_trade_cost
-    
-    # Track cash without interest for interest calculation
-    cash_without_interest = cash_balances[0]
-    
-    # Daily loop
-    for i in range(1, N + 1):
-        t = time_points[i]
-        S_t = stock_prices[i]
-        S_prev = stock_prices[i - 1]
-        tau = max(0, T - t)
-        
-        # Calculate option price and delta at current stock price
-        if tau > 0:
-            option_prices[i] = black_scholes_price(S_t, K, r, sigma, tau, option_type) * total_shares_underlying * initial_option_position
-            deltas[i] = black_scholes_delta(S_t, K, r, sigma, tau, option_type) * initial_option_position
-        else:
-            # At expiration
-            if option_type == "call":
-                option_prices[i] = max(0, S_t - K) * total_shares_underlying * initial_option_position
-            else:  # put
-                option_prices[i] = max(0, K - S_t) * total_shares_underlying * initial_option_position
-            deltas[i] = (1.0 if (option_type == "call" and S_t > K) or (option_type == "put" and S_t < K) else 0.0) * initial_option_position
-        
-        # Determine hedge position needed: H_t = -Δ_t × (option position)
-        required_hedge = -deltas[i] * total_shares_underlying
-        
-        # Apply interest on cash before rebalancing
-        cash_balances[i] = cash_balances[i - 1] * math.exp(r * dt_actual)
-        
-        # Adjust hedge by trading underlying: ΔH_t = H_t - H_{t-1}
-        hedge_adjustment = required_hedge - hedge_positions[i - 1]
-        
-        # Update cash: cash_t = cash_{t-1} - ΔH_t * S_t
-        # (buying underlying reduces cash, selling increases)
-        cash_balances[i] -= hedge_adjustment * S_t
-        
-        # Track cash without interest (for interest calculation)
-        cash_without_interest -= hedge_adjustment * S_t
-        
-        # Pay transaction cost
-        if abs(hedge_adjustment) > 1e-10:
-            trade_cost = abs(hedge_adjustment) * S_t * transaction_cost
-            cumulative_transaction_cost += trade_cost
-            cash_balances[i] -= trade_cost
-            cash_without_interest -= trade_cost
-        
-        # Update hedge position
-        hedge_positions[i] = required_hedge
-        
-        # Track hedging P&L: Σ[H_{t-1}(S_t - S_{t-1})]
-        hedging_pnl += hedge_positions[i - 1] * (S_t - S_prev)
-    
-    # Add interest on cash to hedging P&L
-    # Interest earned = final_cash (with interest) - final_cash (without interest)
-    interest_on_cash = cash_balances[-1] - cash_without_interest
-    hedging_pnl += interest_on_cash
+    # Option prices and deltas along the whole path in one vectorized pass
+    tau = np.maximum(0.0, T - time_points)
+    bs_prices, bs_deltas = _bs_price_delta_vector(stock_prices, K, r, sigma, tau, option_type)
+    option_prices = bs_prices * total_shares_underlying * initial_option_position
+    deltas = bs_deltas * initial_option_position
+    # After the start, the hedge at expiration targets the in-the-money
+    # indicator (1 for puts as well as calls)
+    expired = tau <= 0
+    expired[0] = False
+    in_the_money = stock_prices > K if option_type == "call" else stock_prices < K
+    deltas[expired] = in_the_money[expired] * initial_option_position
+    
+    # Cash and hedge bookkeeping (compiled)
+    (
+        hedge_positions,
+        cash_balances,
+        hedging_pnl,
+        cumulative_transaction_cost,
+        initial_trade_cost,
+    ) = _hedge_loop(
+        stock_prices,
+        deltas,
+        option_prices[0],
+        dt_actual,
+        r,
+        transaction_cost,
+        float(total_shares_underlying),
+        rebalance_threshold,
+    )
     
     # Calculate portfolio values: Π_t = option_price(t) + H_t * S_t + cash_t
-    portfolio_values = np.zeros(N + 1)
-    for i in range(N + 1):
-        portfolio_values[i] = option_prices[i] + hedge_positions[i] * stock_prices[i] + cash_balances[i]
+    portfolio_values = option_prices + hedge_positions * stock_prices + cash_balances
     
     # Calculate P&L components
     initial_portfolio_value = portfolio_values[0]
@@ -275,94 +515,69 @@ def run_delta_hedge(
     # Final error (hedging inefficiency): Option payoff + cash_T + H_T * S_T - 0
     replication_error = final_option_payoff + cash_balances[-1] + hedge_positions[-1] * stock_prices[-1]
     
-    # Build time series data
-    # Track cumulative transaction cost over time
-    cumulative_tx_cost_array = np.zeros(N + 1)
-    cumulative_tx_cost_array[0] = initial_trade_cost
-    current_tx_cost = initial_trade_cost
-    
-    time_series = []
-    for i in range(N + 1):
-        if i > 0:
-            # Check if there was a transaction at this step
-            if abs(hedge_positions[i] - hedge_positions[i - 1]) > 1e-10:
-                trade_cost = abs(hedge_positions[i] - hedge_positions[i - 1]) * stock_prices[i] * transaction_cost
-                current_tx_cost += trade_cost
-            cumulative_tx_cost_array[i] = current_tx_cost
-        
-        time_series.append({
-            "time": round(time_points[i], 6),
-            "stock_price": round(stock_prices[i], 4),
-            "delta": round(deltas[i], 6),
-            "hedge_shares": round(hedge_positions[i], 2),
-            "option_value": round(option_prices[i], 2),
-            "cash": round(cash_balances[i], 2),
-            "portfolio_value": round(portfolio_values[i], 2),
-            "pnl": round(portfolio_values[i] - initial_portfolio_value, 2),
-            "cumulative_transaction_cost": round(cumulative_tx_cost_array[i], 2),
-        })
-    
-    # Build transactions list (rebalancing events)
-    transactions = []
-    cumulative_hedge_pnl = 0.0  # Track cumulative hedging P&L
-    
-    # Initial transaction
-    if abs(hedge_positions[0]) > 1e-10:
-        transactions.append({
-            "time": round(time_points[0], 6),
-            "stock_price": round(stock_prices[0], 4),
-            "delta": round(deltas[0], 6),
-            "delta_change": 0.0,
-            "shares_traded": round(hedge_positions[0], 2),
-            "total_shares": round(hedge_positions[0], 2),
-            "trade_cost": round(initial_trade_cost, 2),
-            "transaction_type": "buy" if hedge_positions[0] > 0 else "sell",
-            "transaction_pnl": 0.0,  # No P&L at initial transaction
-            "total_pnl": 0.0,  # No cumulative P&L yet
-            "option_loss_since_last": 0.0,
-            "portfolio_pnl": 0.0,
-            "cash": round(cash_balances[0], 2),
-        })
-    
-    # Subsequent transactions
-    for i in range(1, N + 1):
-        if abs(hedge_positions[i] - hedge_positions[i - 1]) > 1e-10:
-            delta_change = deltas[i] - deltas[i - 1]
-            shares_traded = hedge_positions[i] - hedge_positions[i - 1]
-            trade_cost = abs(shares_traded) * stock_prices[i] * transaction_cost if abs(shares_traded) > 1e-10 else 0.0
-            option_pnl_since_last = option_prices[i] - option_prices[i - 1]
-            portfolio_pnl_at_tx = portfolio_values[i] - initial_portfolio_value
-            
-            # Transaction P&L: P&L from holding hedge position H_{t-1} from t-1 to t
-            # This is: H_{t-1} * (S_t - S_{t-1})
-            transaction_pnl = hedge_positions[i - 1] * (stock_prices[i] - stock_prices[i - 1])
-            cumulative_hedge_pnl += transaction_pnl
-            
-            transactions.append({
-                "time": round(time_points[i], 6),
-                "stock_price": round(stock_prices[i], 4),
-                "delta": round(deltas[i], 6),
-                "delta_change": round(delta_change, 6),
-                "shares_traded": round(shares_traded, 2),
-                "total_shares": round(hedge_positions[i], 2),
-                "trade_cost": round(trade_cost, 2),
-                "transaction_type": "buy" if shares_traded > 0 else "sell",
-                "transaction_pnl": round(transaction_pnl, 2),
-                "total_pnl": round(cumulative_hedge_pnl, 2),
-                "option_loss_since_last": round(option_pnl_since_last, 2),
-                "portfolio_pnl": round(portfolio_pnl_at_tx, 2),
-                "cash": round(cash_balances[i], 2),
-            })
+    # Shares traded at each step; step 0 is the initial hedge
+    shares_traded = np.empty(N + 1)
+    shares_traded[0] = hedge_positions[0]
+    shares_traded[1:] = np.diff(hedge_positions)
+    traded = np.abs(shares_traded) > 1e-10
+    
+    # Track cumulative transaction cost over time: the cost of each step's
+    # trade (zero where no trade happened), accumulated from the initial hedge
+    step_costs = np.where(traded, np.abs(shares_traded) * stock_prices * transaction_cost, 0.0)
+    cumulative_tx_cost_array = np.cumsum(step_costs)
+    
+    # Build transactions (rebalancing events) as parallel columns, gathering
+    # the steps with a trade. Changes since the previous step are zero for
+    # the initial hedge.
+    delta_changes = np.empty(N + 1)
+    delta_changes[0] = 0.0
+    delta_changes[1:] = np.diff(deltas)
+    option_changes = np.empty(N + 1)
+    option_changes[0] = 0.0
+    option_changes[1:] = np.diff(option_prices)
+    
+    # Transaction P&L: P&L from holding hedge position H_{t-1} from t-1 to t
+    # This is: H_{t-1} * (S_t - S_{t-1})
+    transaction_pnls = np.empty(N + 1)
+    transaction_pnls[0] = 0.0
+    transaction_pnls[1:] = hedge_positions[:-1] * np.diff(stock_prices)
+    transaction_pnls = transaction_pnls[traded]
+    
+    transactions = {
+        "time": np.round(time_points[traded], 6).tolist(),
+        "stock_price": np.round(stock_prices[traded], 4).tolist(),
+        "delta": np.round(deltas[traded], 6).tolist(),
+        "delta_change": np.round(delta_changes[traded], 6).tolist(),
+        "shares_traded": np.round(shares_traded[traded], 2).tolist(),
+        "total_shares": np.round(hedge_positions[traded], 2).tolist(),
+        "trade_cost": np.round(step_costs[traded], 2).tolist(),
+        "transaction_type": np.where(shares_traded[traded] > 0, "buy", "sell").tolist(),
+        "transaction_pnl": np.round(transaction_pnls, 2).tolist(),
+        "total_pnl": np.round(np.cumsum(transaction_pnls), 2).tolist(),
+        "option_loss_since_last": np.round(option_changes[traded], 2).tolist(),
+        "portfolio_pnl": np.round(portfolio_values[traded] - initial_portfolio_value, 2).tolist(),
+        "cash": np.round(cash_balances[traded], 2).tolist(),
+    }
     
     # Calculate max drawdown
-    max_drawdown = 0.0
-    peak = portfolio_values[0]
-    for value in portfolio_values:
-        if value > peak:
-            peak = value
-        drawdown = peak - value
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
+    max_drawdown = float(np.max(np.maximum.accumulate(portfolio_values) - portfolio_values))
+    
+    # Time series as structure-of-arrays, each series rounded once with NumPy.
+    # The full-precision arrays are not used past this point, so they are
+    # rounded in place instead of copied (the values must stay float64: the
+    # rounded decimals are not representable in float32).
+    pnl = portfolio_values - initial_portfolio_value
+    time_series = {
+        "time": np.round(time_points, 6, out=time_points),
+        "stock_price": np.round(stock_prices, 4, out=stock_prices),
+        "delta": np.round(deltas, 6, out=deltas),
+        "hedge_shares": np.round(hedge_positions, 2, out=hedge_positions),
+        "option_value": np.round(option_prices, 2, out=option_prices),
+        "cash": np.round(cash_balances, 2, out=cash_balances),
+        "portfolio_value": np.round(portfolio_values, 2, out=portfolio_values),
+        "pnl": np.round(pnl, 2, out=pnl),
+        "cumulative_transaction_cost": np.round(cumulative_tx_cost_array, 2, out=cumulative_tx_cost_array),
+    }
     
     return {
         "time_series": time_series,
@@ -381,12 +596,97 @@ def run_delta_hedge(
     }
 
 
-def _parse_rebalance_freq(freq: str, T: float) -> float:
+def run_delta_hedge_batch(
+    S0: float,
+    K: float,
+    sigma: float,
+    r: float,
+    T: float,
+    option_type: OptionType,
+    N: int,
+    num_paths: int,
+    initial_option_position: float = 1.0,
+    seed: Optional[int] = None,
+    transaction_cost: float = 0.0,
+    option_contracts: int = 1,
+    qmc: bool = False,
+    rebalance_threshold: float = 0.0,
+) -> dict:
+    """Run the delta hedge over many independent paths in parallel.
+    
+    Only the summary figures of each path are kept; use `run_delta_hedge`
+    for the full time series of a single path.
+    
+    With qmc=True the normals come from a scrambled Sobol sequence (one
+    N-dimensional point per path, mapped through the inverse normal CDF),
+    which lowers the error of P&L statistics for a given number of paths.
+    Powers of two for num_paths keep the sequence balanced.
+    
+    Args:
+        S0: Initial underlying price
+        K: Strike
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity (years)
+        option_type: "call" or "put"
+        N: Number of rebalancing steps per path
+        num_paths: Number of simulated paths
+        initial_option_position: Usually +1 for long one option
+        seed: Random seed for path generation
+        transaction_cost: Transaction cost as fraction (e.g., 0.001 = 0.1%)
+        option_contracts: Number of option contracts (100 shares per contract)
+        qmc: Use scrambled Sobol quasi-random normals instead of pseudo-random ones
+        rebalance_threshold: Minimum hedge change (shares) worth trading
+    
+    Returns:
+        Dictionary of per-path arrays: "total_pnl", "total_transaction_cost"
+        and "replication_error"
+    """
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+    if N < 1 or num_paths < 1:
+        raise ValueError("N and num_paths must be positive")
+    if rebalance_threshold < 0:
+        raise ValueError("rebalance_threshold must be non-negative")
+    
+    # All normals in one draw: row p drives path p
+    if qmc:
+        # scipy.stats is slow to import and only needed here
+        from scipy.stats.qmc import Sobol
+        
+        sampler = Sobol(d=N, scramble=True, seed=seed)
+        Z = ndtri(sampler.random(num_paths))
+    else:
+        rng = np.random.default_rng(seed) if seed is not None else _RNG
+        Z = rng.standard_normal(size=(num_paths, N), dtype=np.float64)
+    
+    results = _simulate_paths_nb(
+        Z,
+        S0,
+        K,
+        r,
+        sigma,
+        T,
+        option_type == "call",
+        transaction_cost,
+        float(option_contracts * 100),
+        initial_option_position,
+        rebalance_threshold,
+    )
+    return {
+        "total_pnl": results[:, 0],
+        "total_transaction_cost": results[:, 1],
+        "replication_error": results[:, 2],
+    }
+
+
+# The API sees the same few frequency strings over and over
+@functools.lru_cache(maxsize=32)
+def _parse_rebalance_freq(freq: str) -> float:
     """Parse rebalancing frequency string to time step in years.
     
     Args:
         freq: Frequency string ('daily', 'weekly', 'biweekly', 'monthly') or number of days
-        T: Time to maturity (years)
     
     Returns:
         Time step in years (dt)
@@ -424,6 +724,7 @@ def simulate_delta_hedging(
     option_contracts: int = 1,
     initial_option_position: float = 1.0,
     seed: Optional[int] = None,
+    rebalance_threshold: float = 0.0,
 ) -> dict:
     """Simulate delta hedging for a single path (API-compatible wrapper).
     
@@ -439,12 +740,13 @@ def simulate_delta_hedging(
         option_contracts: Number of option contracts (100 shares per contract)
         initial_option_position: Usually +1 for long one option
         seed: Random seed for stock path generation
+        rebalance_threshold: Minimum hedge change (shares) worth trading
     
     Returns:
-        Dictionary with time series data and summary statistics
+        Dictionary with time series data (structure-of-arrays) and summary statistics
     """
     # Parse rebalancing frequency
-    dt = _parse_rebalance_freq(rebalance_freq, T)
+    dt = _parse_rebalance_freq(rebalance_freq)
     
     # Calculate number of steps
     N = int(math.ceil(T / dt))
@@ -463,6 +765,7 @@ def simulate_delta_hedging(
         seed=seed,
         transaction_cost=transaction_cost,
         option_contracts=option_contracts,
+        rebalance_threshold=rebalance_threshold,
     )
 
 
@@ -511,8 +814,8 @@ def main() -> None:
     print(f"  Replication Error: ${result['summary']['replication_error']:.2f}")
     print(f"  Final Portfolio Value: ${result['summary']['final_portfolio_value']:.2f}")
     print()
-    print(f"Number of time steps: {len(result['time_series'])}")
-    print(f"Number of transactions: {len(result['transactions'])}")
+    print(f"Number of time steps: {len(result['time_series']['time'])}")
+    print(f"Number of transactions: {len(result['transactions']['time'])}")
 
 
 if __name__ == "__main__":
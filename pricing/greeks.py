@@ -5,18 +5,31 @@ This module provides:
 - Numerical (finite difference) Greeks for Binomial and Monte Carlo methods
 """
 
+import functools
 import math
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional, Sequence, Union
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
-from .black_scholes import _d1, _d2
+from .black_scholes import _Phi, _d1, _d2
 from .binomial import price_european as binomial_price
-from .monte_carlo import mc_price_european as mc_price
+from .binomial import step_two_nodes
 
 OptionType = Literal["call", "put"]
 
+# 1 / sqrt(2*pi), for the standard normal PDF
+_INV_SQRT_2PI = 0.3989422804014327
+
+
+def _option_sign(option_type: OptionType) -> float:
+    """Map 'call'/'put' to +1.0/-1.0 once, so the call/put split is arithmetic."""
+    if option_type == "call":
+        return 1.0
+    if option_type == "put":
+        return -1.0
+    raise ValueError("option_type must be 'call' or 'put'")
+
 
 def delta(S0: float, K: float, r: float, sigma: float, T: float, option_type: OptionType) -> float:
     """Calculate option delta (sensitivity to stock price changes).
@@ -38,14 +51,11 @@ def delta(S0: float, K: float, r: float, sigma: float, T: float, option_type: Op
     if sigma <= 0 or T <= 0:
         raise ValueError("sigma and T must be positive")
     
+    sign = _option_sign(option_type)
     d1_val = _d1(S0, K, r, sigma, T)
     
-    if option_type == "call":
-        return norm.cdf(d1_val)
-    elif option_type == "put":
-        return norm.cdf(d1_val) - 1.0
-    else:
-        raise ValueError("option_type must be 'call' or 'put'")
+    # Put delta is the call delta shifted down by one
+    return _Phi(d1_val) + 0.5 * (sign - 1.0)
 
 
 def gamma(S0: float, K: float, r: float, sigma: float, T: float) -> float:
@@ -69,7 +79,7 @@ def gamma(S0: float, K: float, r: float, sigma: float, T: float) -> float:
     
     d1_val = _d1(S0, K, r, sigma, T)
     # Standard normal PDF: N'(x) = (1/sqrt(2*pi)) * exp(-x^2/2)
-    n_prime_d1 = norm.pdf(d1_val)
+    n_prime_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1_val * d1_val)
     
     return n_prime_d1 / (S0 * sigma * math.sqrt(T))
 
@@ -94,24 +104,16 @@ def theta(S0: float, K: float, r: float, sigma: float, T: float, option_type: Op
     if sigma <= 0 or T <= 0:
         raise ValueError("sigma and T must be positive")
     
+    sign = _option_sign(option_type)
     d1_val = _d1(S0, K, r, sigma, T)
     d2_val = _d2(d1_val, sigma, T)
-    n_prime_d1 = norm.pdf(d1_val)
+    n_prime_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1_val * d1_val)
     
-    if option_type == "call":
-        theta_val = (
-            -S0 * n_prime_d1 * sigma / (2 * math.sqrt(T))
-            - r * K * math.exp(-r * T) * norm.cdf(d2_val)
-        )
-    elif option_type == "put":
-        theta_val = (
-            -S0 * n_prime_d1 * sigma / (2 * math.sqrt(T))
-            + r * K * math.exp(-r * T) * norm.cdf(-d2_val)
-        )
-    else:
-        raise ValueError("option_type must be 'call' or 'put'")
-    
-    return theta_val
+    # Call: -r K e^{-rT} N(d2); put: +r K e^{-rT} N(-d2)
+    return (
+        -S0 * n_prime_d1 * sigma / (2 * math.sqrt(T))
+        - sign * (r * K * math.exp(-r * T) * _Phi(sign * d2_val))
+    )
 
 
 def vega(S0: float, K: float, r: float, sigma: float, T: float) -> float:
@@ -135,7 +137,7 @@ def vega(S0: float, K: float, r: float, sigma: float, T: float) -> float:
         raise ValueError("sigma and T must be positive")
     
     d1_val = _d1(S0, K, r, sigma, T)
-    n_prime_d1 = norm.pdf(d1_val)
+    n_prime_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1_val * d1_val)
     
     # Standard formula gives per unit change, convert to per 1% change
     return S0 * n_prime_d1 * math.sqrt(T) / 100.0
@@ -162,19 +164,33 @@ def rho(S0: float, K: float, r: float, sigma: float, T: float, option_type: Opti
     if sigma <= 0 or T <= 0:
         raise ValueError("sigma and T must be positive")
     
+    sign = _option_sign(option_type)
     d1_val = _d1(S0, K, r, sigma, T)
     d2_val = _d2(d1_val, sigma, T)
     
     # Standard formula gives per unit change, convert to per 1% change
-    if option_type == "call":
-        return K * T * math.exp(-r * T) * norm.cdf(d2_val) / 100.0
-    elif option_type == "put":
-        return -K * T * math.exp(-r * T) * norm.cdf(-d2_val) / 100.0
-    else:
-        raise ValueError("option_type must be 'call' or 'put'")
+    return sign * (K * T * math.exp(-r * T) * _Phi(sign * d2_val)) / 100.0
 
 
-def calculate_all_greeks(S0: float, K: float, r: float, sigma: float, T: float, option_type: OptionType) -> dict:
+class Greeks(NamedTuple):
+    """Black-Scholes Greeks for a single option (immutable, safe to cache)."""
+
+    delta: float
+    gamma: float
+    theta: float
+    vega: float
+    rho: float
+
+
+def _calculate_all_greeks_impl(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    option_type: OptionType,
+    theta_scale: float = 1.0,
+) -> Greeks:
     """Calculate all Greeks for an option using Black-Scholes analytical formulas.
     
     Args:
@@ -184,16 +200,106 @@ def calculate_all_greeks(S0: float, K: float, r: float, sigma: float, T: float,
         sigma: Volatility
         T: Time to maturity (years)
         option_type: 'call' or 'put'
+        theta_scale: Multiplier applied to theta, which is per year by default
+                     (e.g. 1/365 for theta per day)
     
     Returns:
-        Dictionary with all five Greeks: delta, gamma, theta, vega, rho
+        Greeks named tuple with all five Greeks: delta, gamma, theta, vega, rho
+    """
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+    sign = _option_sign(option_type)
+    
+    # Shared terms, each evaluated once for all five Greeks (same formulas
+    # as the individual functions above)
+    sqrt_T = math.sqrt(T)
+    d1_val = _d1(S0, K, r, sigma, T)
+    d2_val = _d2(d1_val, sigma, T)
+    n_prime_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1_val * d1_val)
+    disc = math.exp(-r * T)
+    decay = -S0 * n_prime_d1 * sigma / (2 * sqrt_T)
+    # N(d2) for a call, N(-d2) for a put
+    N_signed_d2 = _Phi(sign * d2_val)
+    
+    return Greeks(
+        delta=_Phi(d1_val) + 0.5 * (sign - 1.0),
+        gamma=n_prime_d1 / (S0 * sigma * sqrt_T),
+        theta=(decay - sign * (r * K * disc * N_signed_d2)) * theta_scale,
+        vega=S0 * n_prime_d1 * sqrt_T / 100.0,
+        rho=sign * (K * T * disc * N_signed_d2) / 100.0,
+    )
+
+
+# Memoized on the exact (S0, K, r, sigma, T, option_type, theta_scale) tuple
+calculate_all_greeks = functools.lru_cache(maxsize=4096)(_calculate_all_greeks_impl)
+
+
+def calculate_all_greeks_vec(
+    S0: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    r: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    option_type: Union[OptionType, Sequence[OptionType], np.ndarray],
+) -> dict:
+    """Vectorized Black-Scholes Greeks over NumPy arrays.
+    
+    Any of the five parameters may be an array; scalars are broadcast against it.
+    option_type may likewise be an array of 'call'/'put' labels, so a mixed book
+    is evaluated in one pass.
+    Units match `calculate_all_greeks` (theta per year, vega and rho per 1% change).
+    
+    Args:
+        S0: Current stock price(s)
+        K: Strike price(s)
+        r: Risk-free rate(s)
+        sigma: Volatility(ies)
+        T: Time(s) to maturity (years)
+        option_type: 'call' or 'put', or an array of them
+    
+    Returns:
+        Dictionary mapping each Greek name to an array of values
     """
+    S0, K, r, sigma, T = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S0, K, r, sigma, T))
+    )
+    if np.any(sigma <= 0) or np.any(T <= 0):
+        raise ValueError("sigma and T must be positive")
+    if np.any(S0 <= 0) or np.any(K <= 0):
+        raise ValueError("S0 and K must be positive")
+    if isinstance(option_type, str):
+        sign = _option_sign(option_type)
+    else:
+        option_type = np.asarray(option_type)
+        is_call = option_type == "call"
+        if not np.all(is_call | (option_type == "put")):
+            raise ValueError("option_type must be 'call' or 'put'")
+        sign = np.where(is_call, 1.0, -1.0)
+        S0, K, r, sigma, T, sign = np.broadcast_arrays(S0, K, r, sigma, T, sign)
+    
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    Nd1 = ndtr(d1)
+    nd1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    disc_K = K * np.exp(-r * T)
+    
+    gamma_val = nd1 / (S0 * sigma * sqrt_T)
+    vega_val = S0 * nd1 * sqrt_T / 100.0
+    decay = -S0 * nd1 * sigma / (2 * sqrt_T)
+    
+    # One branch-free pass for calls, puts or a mix: sign is +1 / -1 per element
+    N_signed_d2 = ndtr(sign * d2)
+    delta_val = Nd1 + 0.5 * (sign - 1.0)
+    theta_val = decay - sign * (r * disc_K * N_signed_d2)
+    rho_val = sign * (disc_K * T * N_signed_d2) / 100.0
+    
     return {
-        "delta": delta(S0, K, r, sigma, T, option_type),
-        "gamma": gamma(S0, K, r, sigma, T),
-        "theta": theta(S0, K, r, sigma, T, option_type),
-        "vega": vega(S0, K, r, sigma, T),
-        "rho": rho(S0, K, r, sigma, T, option_type),
+        "delta": delta_val,
+        "gamma": gamma_val,
+        "theta": theta_val,
+        "vega": vega_val,
+        "rho": rho_val,
     }
 
 
@@ -206,9 +312,14 @@ def calculate_binomial_greeks(
     option_type: OptionType,
     N: int = 1000,
     perturbation: float = 0.01,
+    theta_scale: float = 1.0,
 ) -> dict:
     """Calculate Greeks using Binomial tree with finite differences.
     
+    Delta and gamma are read off the tree's step-2 nodes when N >= 3 (finite
+    differences of perturbed trees otherwise); theta, vega and rho use
+    finite differences.
+    
     Args:
         S0: Current stock price
         K: Strike price
@@ -218,6 +329,8 @@ def calculate_binomial_greeks(
         option_type: 'call' or 'put'
         N: Number of steps in binomial tree
         perturbation: Relative perturbation for finite differences (e.g., 0.01 = 1%)
+        theta_scale: Multiplier applied to theta, which is per year by default
+                     (e.g. 1/365 for theta per day)
     
     Returns:
         Dictionary with all five Greeks: delta, gamma, theta, vega, rho
@@ -225,25 +338,37 @@ def calculate_binomial_greeks(
     # Base price
     base_price = binomial_price(S0, K, r, sigma, T, N, option_type)
     
-    # Delta: dV/dS
-    dS = S0 * perturbation
-    price_up = binomial_price(S0 + dS, K, r, sigma, T, N, option_type)
-    price_down = binomial_price(S0 - dS, K, r, sigma, T, N, option_type)
-    delta_val = (price_up - price_down) / (2 * dS)
-    
-    # Gamma: d²V/dS²
-    # Use averaging of N and N+1 step trees to smooth out oscillations
-    # Binomial trees can have odd-even step errors that cause jagged pricing functions
-    base_price_N1 = binomial_price(S0, K, r, sigma, T, N + 1, option_type)
-    price_up_N1 = binomial_price(S0 + dS, K, r, sigma, T, N + 1, option_type)
-    price_down_N1 = binomial_price(S0 - dS, K, r, sigma, T, N + 1, option_type)
-    
-    # Average the base prices and perturbed prices from N and N+1 step trees
-    base_avg = (base_price + base_price_N1) / 2.0
-    price_up_avg = (price_up + price_up_N1) / 2.0
-    price_down_avg = (price_down + price_down_N1) / 2.0
-    
-    gamma_val = (price_up_avg - 2 * base_avg + price_down_avg) / (dS * dS)
+    if N >= 3:
+        # Delta and gamma from the tree itself: the three nodes at step 2
+        # (S0*u^2, S0, S0*d^2) already carry option values, so no perturbed
+        # trees are needed
+        (S_uu, S_ud, S_dd), (V_uu, V_ud, V_dd) = step_two_nodes(
+            S0, K, r, sigma, T, N, option_type
+        )
+        delta_val = (V_uu - V_dd) / (S_uu - S_dd)
+        gamma_val = (
+            (V_uu - V_ud) / (S_uu - S_ud) - (V_ud - V_dd) / (S_ud - S_dd)
+        ) / (0.5 * (S_uu - S_dd))
+    else:
+        # Delta: dV/dS
+        dS = S0 * perturbation
+        price_up = binomial_price(S0 + dS, K, r, sigma, T, N, option_type)
+        price_down = binomial_price(S0 - dS, K, r, sigma, T, N, option_type)
+        delta_val = (price_up - price_down) / (2 * dS)
+        
+        # Gamma: d²V/dS²
+        # Use averaging of N and N+1 step trees to smooth out oscillations
+        # Binomial trees can have odd-even step errors that cause jagged pricing functions
+        base_price_N1 = binomial_price(S0, K, r, sigma, T, N + 1, option_type)
+        price_up_N1 = binomial_price(S0 + dS, K, r, sigma, T, N + 1, option_type)
+        price_down_N1 = binomial_price(S0 - dS, K, r, sigma, T, N + 1, option_type)
+        
+        # Average the base prices and perturbed prices from N and N+1 step trees
+        base_avg = (base_price + base_price_N1) / 2.0
+        price_up_avg = (price_up + price_up_N1) / 2.0
+        price_down_avg = (price_down + price_down_N1) / 2.0
+        
+        gamma_val = (price_up_avg - 2 * base_avg + price_down_avg) / (dS * dS)
     
     # Theta: -dV/dT (negative because time decreases)
     # As time passes (T decreases), option value decreases
@@ -251,7 +376,7 @@ def calculate_binomial_greeks(
     # Therefore theta = -(base_price - price_time) / dT = (price_time - base_price) / dT (negative)
     dT = max(T * perturbation, 0.001)  # Ensure positive
     price_time = binomial_price(S0, K, r, sigma, T - dT, N, option_type)
-    theta_val = (price_time - base_price) / dT
+    theta_val = (price_time - base_price) / dT * theta_scale
     
     # Vega: dV/dσ (per 1% change in volatility)
     # Use original finite difference formula, then divide by 100 to convert to per 1% change
@@ -286,13 +411,21 @@ def calculate_mc_greeks(
     T: float,
     option_type: OptionType,
     N: int = 100000,
-    perturbation: float = 0.01,
+    *,
     seed: Optional[int] = None,
+    theta_scale: float = 1.0,
 ) -> dict:
-    """Calculate Greeks using Monte Carlo with finite differences.
+    """Calculate Greeks using Monte Carlo with pathwise and likelihood-ratio estimators.
+    
+    Arguments after N are keyword-only: the former `perturbation` parameter
+    was removed, and old positional calls must fail rather than shift into
+    `seed`.
     
-    Uses the same random seed for all calculations to ensure consistency.
-    This reduces variance by using the same random numbers across all finite difference calculations.
+    All five Greeks are computed from the same simulated terminal prices as
+    the base price, in a single vectorized pass. Delta, vega, theta and rho
+    use pathwise derivatives of the discounted payoff; gamma uses the
+    likelihood-ratio weight, since the pathwise second derivative of a
+    kinked payoff is zero almost everywhere.
     
     Args:
         S0: Current stock price
@@ -302,58 +435,57 @@ def calculate_mc_greeks(
         T: Time to maturity (years)
         option_type: 'call' or 'put'
         N: Number of Monte Carlo simulations
-        perturbation: Relative perturbation for finite differences (e.g., 0.01 = 1%)
-        seed: Random seed for reproducibility (use same seed for all calculations)
+        seed: Random seed for reproducibility
+        theta_scale: Multiplier applied to theta, which is per year by default
+                     (e.g. 1/365 for theta per day)
     
     Returns:
         Dictionary with all five Greeks: delta, gamma, theta, vega, rho
     """
+    if N <= 0:
+        raise ValueError("N must be positive")
+    if sigma <= 0 or T <= 0:
+        raise ValueError("sigma and T must be positive")
+    if option_type not in ("call", "put"):
+        raise ValueError("option_type must be 'call' or 'put'")
+    
     # Use a fixed seed if not provided to ensure reproducibility
     if seed is None:
         seed = 42
     
-    # Base price
-    base_price = mc_price(S0, K, r, sigma, T, N, option_type, seed=seed)
+    sqrt_T = math.sqrt(T)
+    # SFC64 is cheaper to seed and faster for bulk normals than the default PCG64
+    Z = np.random.Generator(np.random.SFC64(seed)).standard_normal(size=N)
+    ST = S0 * np.exp((r - 0.5 * sigma * sigma) * T + sigma * sqrt_T * Z)
+    disc = math.exp(-r * T)
     
-    # Delta: dV/dS
-    dS = S0 * perturbation
-    price_up = mc_price(S0 + dS, K, r, sigma, T, N, option_type, seed=seed)
-    price_down = mc_price(S0 - dS, K, r, sigma, T, N, option_type, seed=seed)
-    delta_val = (price_up - price_down) / (2 * dS)
+    # Payoff and its derivative with respect to S_T
+    if option_type == "call":
+        payoff = np.maximum(ST - K, 0.0)
+        dpayoff = (ST > K).astype(float)
+    else:
+        payoff = np.maximum(K - ST, 0.0)
+        dpayoff = -(ST < K).astype(float)
     
-    # Gamma: d²V/dS²
-    gamma_val = (price_up - 2 * base_price + price_down) / (dS * dS)
+    price = disc * float(np.mean(payoff))
+    dST = dpayoff * ST
     
-    # Theta: -dV/dT (negative because time decreases)
-    # As time passes (T decreases), option value decreases
-    # theta = -∂V/∂T where ∂V/∂T ≈ (V(T) - V(T-dT)) / dT = (base_price - price_time) / dT (positive)
-    # Therefore theta = -(base_price - price_time) / dT = (price_time - base_price) / dT (negative)
-    dT = max(T * perturbation, 0.001)  # Ensure positive
-    price_time = mc_price(S0, K, r, sigma, T - dT, N, option_type, seed=seed)
-    theta_val = (price_time - base_price) / dT
+    # Delta (pathwise): dS_T/dS0 = S_T / S0
+    delta_val = disc * float(np.mean(dST)) / S0
     
-    # Vega: dV/dσ (per 1% change in volatility)
-    # Use original finite difference formula, then divide by 100 to convert to per 1% change
-    dsigma = sigma * perturbation
-    price_vol_up = mc_price(S0, K, r, sigma + dsigma, T, N, option_type, seed=seed)
-    price_vol_down = mc_price(S0, K, r, sigma - dsigma, T, N, option_type, seed=seed)
-    # Original formula gives per unit change, divide by 100 for per 1% change
-    vega_val = (price_vol_up - price_vol_down) / (2 * dsigma) / 100.0
+    # Gamma (likelihood ratio)
+    lr_weight = (Z * Z - Z * sigma * sqrt_T - 1.0) / (S0 * S0 * sigma * sigma * T)
+    gamma_val = disc * float(np.mean(payoff * lr_weight))
     
-    # Rho: dV/dr (per 1% change in interest rate)
-    # Use original finite difference formula with larger perturbation for stability, then divide by 100
-    # Rho is particularly sensitive because it affects both drift and discount factor
-    if r > 0:
-        # Use at least 0.01 (1%) absolute change, or relative perturbation if larger
-        dr = max(r * perturbation, 0.01)
-    else:
-        dr = 0.01
-    # Ensure we don't go negative
-    dr = min(dr, r) if r > 0 else 0.01
-    price_rate_up = mc_price(S0, K, r + dr, sigma, T, N, option_type, seed=seed)
-    price_rate_down = mc_price(S0, K, max(0, r - dr), sigma, T, N, option_type, seed=seed)
-    # Original formula gives per unit change, divide by 100 for per 1% change
-    rho_val = (price_rate_up - price_rate_down) / (2 * dr) / 100.0
+    # Theta: -dV/dT, with dS_T/dT = S_T * (r - sigma^2/2 + sigma*Z/(2*sqrt(T)))
+    dST_dT = r - 0.5 * sigma * sigma + sigma * Z / (2.0 * sqrt_T)
+    theta_val = -(-r * price + disc * float(np.mean(dST * dST_dT))) * theta_scale
+    
+    # Vega: dS_T/dsigma = S_T * (sqrt(T)*Z - sigma*T), per 1% change in volatility
+    vega_val = disc * float(np.mean(dST * (sqrt_T * Z - sigma * T))) / 100.0
+    
+    # Rho: discount term plus dS_T/dr = S_T * T, per 1% change in interest rate
+    rho_val = (-T * price + disc * T * float(np.mean(dST))) / 100.0
     
     return {
         "delta": delta_val,
@@ -399,16 +531,17 @@ def calculate_all_greeks_comparison(
             "monte_carlo": {delta, gamma, theta, vega, rho}
         }
     """
-    bs_greeks = calculate_all_greeks(S0, K, r, sigma, T, option_type)
-    binomial_greeks = calculate_binomial_greeks(S0, K, r, sigma, T, option_type, binomial_steps)
-    # Use fixed seed for Monte Carlo to ensure same random numbers across all finite difference calculations
-    mc_greeks = calculate_mc_greeks(S0, K, r, sigma, T, option_type, mc_simulations, seed=mc_seed)
+    # Theta is per year by default; each method applies the per-day scale itself
+    theta_scale = 1.0 / 365.0 if theta_period == "day" else 1.0
     
-    # Convert theta to per day if requested (theta is calculated per year by default)
-    if theta_period == "day":
-        bs_greeks["theta"] = bs_greeks["theta"] / 365.0
-        binomial_greeks["theta"] = binomial_greeks["theta"] / 365.0
-        mc_greeks["theta"] = mc_greeks["theta"] / 365.0
+    bs_greeks = calculate_all_greeks(S0, K, r, sigma, T, option_type, theta_scale)._asdict()
+    binomial_greeks = calculate_binomial_greeks(
+        S0, K, r, sigma, T, option_type, binomial_steps, theta_scale=theta_scale
+    )
+    # Use fixed seed for Monte Carlo to ensure same random numbers across all finite difference calculations
+    mc_greeks = calculate_mc_greeks(
+        S0, K, r, sigma, T, option_type, mc_simulations, seed=mc_seed, theta_scale=theta_scale
+    )
     
     return {
         "black_scholes": bs_greeks,
@@ -1,14 +1,63 @@
 """Analysis tools for comparing different delta hedging strategies."""
 
+import math
 from typing import List, Literal
 
 import numpy as np
 
-from .delta_hedging import simulate_delta_hedging
+from ._jit import PARALLEL, jit, prange
+from .delta_hedging import _parse_rebalance_freq, _simulate_one_path
 
 OptionType = Literal["call", "put"]
 
 
+@jit(cache=True, nogil=True, parallel=PARALLEL)
+def _compare_freqs_nb(
+    Z: np.ndarray,
+    steps: np.ndarray,
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    is_call: bool,
+    transaction_cost: float,
+    total_shares_underlying: float,
+) -> np.ndarray:
+    """Run every (frequency, simulation) pair in parallel.
+    
+    Row `s` of `Z` drives simulation `s`; a frequency with `steps[f]`
+    rebalances uses the first `steps[f]` normals of that row.
+    
+    Returns:
+        Array of shape (n_freq, n_sim, 3) holding
+        (final_pnl, total_transaction_cost, hedging_error) per path
+    """
+    n_freq = steps.shape[0]
+    n_sim = Z.shape[0]
+    results = np.empty((n_freq, n_sim, 3))
+    for k in prange(n_freq * n_sim):
+        f = k // n_sim
+        s = k % n_sim
+        pnl, tc, he = _simulate_one_path(
+            Z[s, : steps[f]],
+            S0,
+            K,
+            r,
+            sigma,
+            T,
+            is_call,
+            transaction_cost,
+            total_shares_underlying,
+            1.0,
+            0.0,
+        )
+        results[f, s, 0] = pnl
+        results[f, s, 1] = tc
+        results[f, s, 2] = he
+    return results
+
+
 def compare_hedging_frequencies(
     S0: float,
     K: float,
@@ -38,46 +87,46 @@ def compare_hedging_frequencies(
     Returns:
         List of dictionaries with statistics for each frequency
     """
-    results = []
+    steps = np.array(
+        [int(math.ceil(T / _parse_rebalance_freq(freq))) for freq in frequencies],
+        dtype=np.int64,
+    )
     
-    for freq in frequencies:
-        pnl_list = []
-        transaction_cost_list = []
-        hedging_error_list = []
-        
-        # Run multiple simulations
-        for sim_idx in range(num_simulations):
-            result = simulate_delta_hedging(
-                S0=S0,
-                K=K,
-                r=r,
-                sigma=sigma,
-                T=T,
-                option_type=option_type,
-                rebalance_freq=freq,
-                transaction_cost=transaction_cost,
-                option_contracts=option_contracts,
-                seed=sim_idx,  # Use seed for reproducibility
-            )
-            
-            summary = result["summary"]
-            pnl_list.append(summary["final_pnl"])
-            transaction_cost_list.append(summary["total_transaction_cost"])
-            hedging_error_list.append(summary["hedging_error"])
-        
-        # Calculate statistics
-        pnl_array = np.array(pnl_list)
-        tc_array = np.array(transaction_cost_list)
-        he_array = np.array(hedging_error_list)
-        
-        results.append({
-            "frequency": freq,
-            "mean_pnl": float(np.mean(pnl_array)),
-            "std_pnl": float(np.std(pnl_array)),
-            "min_pnl": float(np.min(pnl_array)),
-            "max_pnl": float(np.max(pnl_array)),
-            "mean_transaction_cost": float(np.mean(tc_array)),
-            "mean_hedging_error": float(np.mean(he_array)),
-        })
+    # Simulation sim_idx is seeded with sim_idx (as in simulate_delta_hedging),
+    # so every frequency sees a prefix of the same normal stream
+    Z = np.empty((num_simulations, int(steps.max())))
+    for sim_idx in range(num_simulations):
+        Z[sim_idx] = np.random.default_rng(sim_idx).standard_normal(size=Z.shape[1])
     
-    return results
+    paths = _compare_freqs_nb(
+        Z,
+        steps,
+        S0,
+        K,
+        r,
+        sigma,
+        T,
+        option_type == "call",
+        transaction_cost,
+        float(option_contracts * 100),
+    )
+    # Summary figures are reported to the cent, as in run_delta_hedge
+    paths = np.round(paths, 2)
+    
+    mean = paths.mean(axis=1)
+    std = paths.std(axis=1)
+    low = paths.min(axis=1)
+    high = paths.max(axis=1)
+    
+    return [
+        {
+            "frequency": freq,
+            "mean_pnl": float(mean[f, 0]),
+            "std_pnl": float(std[f, 0]),
+            "min_pnl": float(low[f, 0]),
+            "max_pnl": float(high[f, 0]),
+            "mean_transaction_cost": float(mean[f, 1]),
+            "mean_hedging_error": float(mean[f, 2]),
+        }
+        for f, freq in enumerate(frequencies)
+    ]
@@ -1,11 +1,43 @@
 import math
-from typing import Literal, Optional, Tuple, Union
+from typing import Dict, Literal, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
+from scipy.special import ndtri
+
+try:
+    from ._monte_carlo_numba import payoff_sums_nb as _payoff_sums_nb
+except ImportError:  # numba not installed: NumPy path only
+    _payoff_sums_nb = None
 
 
 OptionType = Literal["call", "put"]
 
+# Shared per-process generator for unseeded runs (PCG64), so calls do not
+# pay for constructing and seeding a fresh Generator each time
+_RNG = np.random.default_rng()
+
+
+def _resolve_rng(seed: Optional[int], rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """Explicit rng first, then a fresh generator for a seed, else the shared one."""
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return np.random.default_rng(seed)
+    return _RNG
+
+
+def _fill_normals(rng: np.random.Generator, out: np.ndarray, qmc: bool) -> None:
+    """Fill out with standard normals: pseudo-random, or scrambled Sobol with qmc."""
+    if qmc:
+        # scipy.stats is slow to import and only needed here
+        from scipy.stats.qmc import Sobol
+
+        u = Sobol(d=1, scramble=True, seed=rng).random(out.size)
+        ndtri(u[:, 0], out=out)
+    else:
+        rng.standard_normal(dtype=out.dtype, out=out)
+
 
 def mc_price_european(
     S0: float,
@@ -18,9 +50,43 @@ def mc_price_european(
     seed: Optional[int] = None,
     rng: Optional[np.random.Generator] = None,
     return_stderr: bool = False,
+    antithetic: bool = False,
+    control_variate: bool = False,
+    qmc: bool = False,
+    dtype: DTypeLike = np.float64,
+    out: Optional[np.ndarray] = None,
 ) -> Union[float, Tuple[float, float]]:
     """Monte Carlo pricing for European call/put under GBM.
 
+    With antithetic=True, ceil(N/2) normals are drawn and each is paired with
+    its negative; the standard error is then computed from the pair averages.
+
+    With control_variate=True, S_T serves as a control with known mean
+    S0*exp(rT): the payoff mean is corrected by beta*(mean(S_T) - S0*exp(rT)),
+    with beta = cov(payoff, S_T)/var(S_T) estimated from the same sample (per
+    pair when combined with antithetic). The standard error is that of the
+    corrected estimator.
+
+    With qmc=True the normals come from a scrambled 1-D Sobol sequence mapped
+    through the inverse normal CDF (seeded from seed/rng), whose error for
+    smooth payoffs falls close to 1/N rather than 1/sqrt(N). Powers of two for
+    N (for the number of pairs with antithetic) keep the sequence balanced.
+    The standard error still uses the iid formula, so it is conservative.
+
+    dtype sets the precision of the path arrays. np.float32 halves the memory
+    traffic of large runs; the price and standard error then carry ~1e-7
+    relative rounding, far below the sampling noise.
+
+    When numba is available, the normals are mapped to payoffs and summed by
+    one fused kernel, so only the normals are ever stored. Without numba the
+    same estimator runs as in-place NumPy passes.
+
+    out, if given, is a preallocated 1-D float32/float64 workspace of at least
+    N elements (N rounded up to even with antithetic=True). The normals are
+    drawn into it (and, on the NumPy path, overwritten in place by the
+    payoffs), so repeated calls can reuse one buffer; its dtype takes
+    precedence over dtype.
+
     Returns price, and optionally standard error of the estimator.
     """
     if N <= 0:
@@ -28,33 +94,158 @@ def mc_price_european(
     if sigma < 0 or T < 0:
         raise ValueError("sigma and T must be non-negative")
 
-    if rng is None:
-        rng = np.random.default_rng(seed)
+    if option not in ("call", "put"):
+        raise ValueError("option must be 'call' or 'put'")
 
     if T == 0:
-        # Immediate maturity
-        ST = np.full(N, S0)
+        # Immediate maturity: the payoff is deterministic, nothing to simulate
+        payoff = float(max(S0 - K, 0.0) if option == "call" else max(K - S0, 0.0))
+        return (payoff, 0.0) if return_stderr else payoff
+
+    rng = _resolve_rng(seed, rng)
+
+    forward = S0 * math.exp(r * T)
+    n_paths = 2 * ((N + 1) // 2) if antithetic else N
+    if out is None:
+        buf = np.empty(n_paths, dtype=dtype)
+    else:
+        if out.ndim != 1 or out.size < n_paths:
+            raise ValueError(f"out must be a 1-D array with at least {n_paths} elements")
+        buf = out[:n_paths]
+
+    if _payoff_sums_nb is not None:
+        # Fused kernel: draw the normals only, then Z -> ST -> payoff -> sums
+        n = n_paths // 2 if antithetic else n_paths
+        Z = buf[:n]
+        _fill_normals(rng, Z, qmc)
+        s_y, s_yy, s_x, s_xx, s_xy = _payoff_sums_nb(
+            Z,
+            float(S0),
+            float(K),
+            (r - 0.5 * sigma * sigma) * T,
+            sigma * math.sqrt(T),
+            option == "call",
+            antithetic,
+            forward,
+        )
+        # Antithetic samples are already pair averages, so both cases are iid
+        c_yy = s_yy - s_y * s_y / n
+        if control_variate:
+            c_xx = s_xx - s_x * s_x / n
+            c_xy = s_xy - s_x * s_y / n
+            beta = c_xy / c_xx if c_xx > 0 else 0.0
+            s_y -= beta * s_x
+            c_yy -= beta * c_xy
+        discount = math.exp(-r * T)
+        price = discount * s_y / n
+        if not return_stderr:
+            return price
+        variance = max(c_yy, 0.0) / (n - 1) if n > 1 else math.nan
+        return price, discount * math.sqrt(variance / n)
+
+    # One workspace, updated in place: Z -> ST -> payoff
+    if antithetic:
+        half = n_paths // 2
+        _fill_normals(rng, buf[:half], qmc)
+        np.negative(buf[:half], out=buf[half:])
     else:
-        Z = rng.standard_normal(size=N)
-        drift = (r - 0.5 * sigma * sigma) * T
-        diffusion = sigma * math.sqrt(T) * Z
-        ST = S0 * np.exp(drift + diffusion)
+        _fill_normals(rng, buf, qmc)
+    drift = (r - 0.5 * sigma * sigma) * T
+    buf *= sigma * math.sqrt(T)
+    buf += drift
+    np.exp(buf, out=buf)
+    buf *= S0
+    if control_variate:
+        # S_T centred on its known mean, saved before buf becomes payoffs
+        control = buf - forward
 
     if option == "call":
-        payoff = np.maximum(ST - K, 0.0)
-    elif option == "put":
-        payoff = np.maximum(K - ST, 0.0)
+        buf -= K
     else:
-        raise ValueError("option must be 'call' or 'put'")
+        np.subtract(K, buf, out=buf)
+    payoff = np.maximum(buf, 0.0, out=buf)
+
+    discount = math.exp(-r * T)
 
-    discount = math.exp(-r * T) if T > 0 else 1.0
-    price = discount * float(np.mean(payoff))
+    if control_variate:
+        if antithetic:
+            n_pairs = payoff.size // 2
+            payoff = 0.5 * (payoff[:n_pairs] + payoff[n_pairs:])
+            control = 0.5 * (control[:n_pairs] + control[n_pairs:])
+        n = payoff.size
+        y_mean = float(np.mean(payoff))
+        x_mean = float(np.mean(control))
+        dy = payoff - y_mean
+        dx = control - x_mean
+        c_xx = float(dx @ dx)
+        c_xy = float(dx @ dy)
+        beta = c_xy / c_xx if c_xx > 0 else 0.0
+        price = discount * (y_mean - beta * x_mean)
+        if not return_stderr:
+            return price
+        variance = max(float(dy @ dy) - beta * c_xy, 0.0) / (n - 1) if n > 1 else math.nan
+        return price, discount * math.sqrt(variance / n)
+
+    # Reductions accumulate in float64 even for float32 paths
+    s_y = float(payoff.sum(dtype=np.float64))
+    price = discount * s_y / payoff.size
 
     if not return_stderr:
         return price
 
-    # Standard error of discounted payoff mean
-    stderr = discount * (float(np.std(payoff, ddof=1)) / math.sqrt(N))
-    return price, stderr
+    # Standard error of discounted payoff mean from the sum and sum of squares
+    # (no centred temporaries, as np.std would allocate)
+    if antithetic:
+        # Antithetic pairs are dependent; the pair averages are the iid samples
+        n = payoff.size // 2
+        samples = np.add(payoff[:n], payoff[n:], out=payoff[:n])
+        samples *= 0.5
+        s_y *= 0.5
+    else:
+        n = payoff.size
+        samples = payoff
+    s_yy = float(np.einsum("i,i->", samples, samples, dtype=np.float64))
+    variance = max(s_yy - s_y * s_y / n, 0.0) / (n - 1) if n > 1 else math.nan
+    return price, discount * math.sqrt(variance / n)
+
+
+def mc_price_european_prefixes(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    Ns: Sequence[int],
+    option: OptionType = "call",
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[int, float]:
+    """Monte Carlo prices for several sample sizes from a single draw.
+
+    Simulates max(Ns) terminal prices once and prices each N with the mean
+    of the first N discounted payoffs, so the estimates are nested prefixes
+    of one sample rather than independent runs.
+
+    Returns a dict mapping each N to its price.
+    """
+    if not Ns or min(Ns) <= 0:
+        raise ValueError("Ns must be non-empty and positive")
+    if sigma < 0 or T < 0:
+        raise ValueError("sigma and T must be non-negative")
+    if option not in ("call", "put"):
+        raise ValueError("option must be 'call' or 'put'")
+
+    rng = _resolve_rng(seed, rng)
+
+    N_max = max(Ns)
+    Z = rng.standard_normal(size=N_max)
+    ST = S0 * np.exp((r - 0.5 * sigma * sigma) * T + sigma * math.sqrt(T) * Z)
 
+    if option == "call":
+        payoff = np.maximum(ST - K, 0.0)
+    else:
+        payoff = np.maximum(K - ST, 0.0)
 
+    discount = math.exp(-r * T)
+    cumulative = np.cumsum(payoff)
+    return {int(N): discount * float(cumulative[N - 1]) / N for N in Ns}
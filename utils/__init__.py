@@ -1,3 +1,3 @@
-"""Utilities package: plotting helpers."""
+"""Utilities package: plotting and line-fitting helpers."""
 
 
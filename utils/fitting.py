@@ -0,0 +1,20 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def linear_fit(x: Sequence[float], y: Sequence[float]) -> Tuple[float, float]:
+    """Closed-form least-squares line through (x, y).
+
+    Uses centred sums, so there is no Vandermonde/SVD setup as in np.polyfit
+    and no cancellation when the x values are large.
+
+    Returns (slope, intercept).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    slope = float((dx @ (y - y_mean)) / (dx @ dx))
+    return slope, float(y_mean - slope * x_mean)
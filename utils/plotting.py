@@ -1,8 +1,17 @@
 import os
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Dict, Iterable, Union
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use("Agg")  # file output only; no GUI backend
+import matplotlib.pyplot as plt  # noqa: E402
+
+from utils.fitting import linear_fit  # noqa: E402
+
+# One figure reused by every plot: each call clears the axes, draws and saves,
+# instead of paying for figure creation and teardown per plot
+_FIG, _AX = plt.subplots(figsize=(6, 4))
 
 
 def _ensure_parent_dir(path: str) -> None:
@@ -27,24 +36,23 @@ def loglog_convergence_plot(
 
     x = np.log10(Ns)
     y = np.log10(errs)
-    coeffs = np.polyfit(x, y, 1)
-    slope, intercept = coeffs[0], coeffs[1]
+    slope, intercept = linear_fit(x, y)
 
     y_fit = slope * x + intercept
 
-    plt.figure(figsize=(6, 4))
-    plt.scatter(x, y, label="data", color="tab:blue")
-    plt.plot(x, y_fit, label=f"fit slope={slope:.3f}", color="tab:orange")
-    plt.xlabel("log10(N)")
-    plt.ylabel("log10(error)")
-    plt.title(title)
-    plt.legend()
-    plt.grid(True, which="both", ls=":", alpha=0.5)
+    ax = _AX
+    ax.clear()
+    ax.scatter(x, y, label="data", color="tab:blue")
+    ax.plot(x, y_fit, label=f"fit slope={slope:.3f}", color="tab:orange")
+    ax.set_xlabel("log10(N)")
+    ax.set_ylabel("log10(error)")
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, which="both", ls=":", alpha=0.5)
 
     _ensure_parent_dir(outfile)
-    plt.tight_layout()
-    plt.savefig(outfile, dpi=150)
-    plt.close()
+    _FIG.tight_layout()
+    _FIG.savefig(outfile, dpi=150)
 
     return float(slope)
 
@@ -63,26 +71,26 @@ def runtime_plot(
     """
     Ns = list(Ns)
 
-    plt.figure(figsize=(6, 4))
+    ax = _AX
+    ax.clear()
 
     if isinstance(times, dict):
         for label, series in times.items():
-            plt.plot(Ns, list(series), marker="o", label=label)
-        plt.legend()
+            ax.plot(Ns, list(series), marker="o", label=label)
+        ax.legend()
     else:
-        plt.plot(Ns, list(times), marker="o")
+        ax.plot(Ns, list(times), marker="o")
 
-    plt.xlabel("N")
-    plt.ylabel("time (s)")
-    plt.title(title)
-    plt.grid(True, which="both", ls=":", alpha=0.5)
+    ax.set_xlabel("N")
+    ax.set_ylabel("time (s)")
+    ax.set_title(title)
+    ax.grid(True, which="both", ls=":", alpha=0.5)
     if logy:
-        plt.yscale("log")
-    plt.xscale("log")
+        ax.set_yscale("log")
+    ax.set_xscale("log")
 
     _ensure_parent_dir(outfile)
-    plt.tight_layout()
-    plt.savefig(outfile, dpi=150)
-    plt.close()
+    _FIG.tight_layout()
+    _FIG.savefig(outfile, dpi=150)
 
 